@@ -1,6 +1,7 @@
 """Image I/O port."""
 from abc import ABC, abstractmethod
 from pathlib import Path
+import numpy as np
 from ...domain.entities.image_input import ImageInput
 from ...domain.entities.image_output import ImageOutput
 
@@ -25,6 +26,23 @@ class ImageIO(ABC):
         """
         pass
     
+    @abstractmethod
+    async def load_image_bytes(self, data: bytes, path: Path) -> ImageInput:
+        """
+        Decode an image file already read into memory.
+        
+        Args:
+            data: Encoded file contents
+            path: Path the bytes were read from (format check, ImageInput.file_path)
+        
+        Returns:
+            ImageInput entity
+        
+        Raises:
+            InvalidImageError: If image is invalid or corrupted
+        """
+        pass
+    
     @abstractmethod
     async def save_png_rgba(self, output: ImageOutput, path: Path) -> None:
         """
@@ -38,3 +56,57 @@ class ImageIO(ABC):
             IOError: If save fails
         """
         pass
+    
+    @abstractmethod
+    async def save_png_1bit(self, mask: np.ndarray, path: Path) -> None:
+        """
+        Save boolean mask as 1-bit black/white PNG.
+        
+        Args:
+            mask: Boolean mask (H, W), True = foreground (white)
+            path: Destination path
+        
+        Raises:
+            IOError: If save fails
+        """
+        pass
+    
+    @abstractmethod
+    async def encode_png_rgba(self, output: ImageOutput) -> bytes:
+        """
+        Encode RGBA image as PNG bytes, as save_png_rgba would write them.
+        
+        Args:
+            output: Image output with alpha channel
+        
+        Returns:
+            PNG file contents
+        """
+        pass
+    
+    @abstractmethod
+    async def encode_png_1bit(self, mask: np.ndarray) -> bytes:
+        """
+        Encode boolean mask as 1-bit PNG bytes, as save_png_1bit would write them.
+        
+        Args:
+            mask: Boolean mask (H, W), True = foreground (white)
+        
+        Returns:
+            PNG file contents
+        """
+        pass
+    
+    @abstractmethod
+    async def save_bytes(self, data: bytes, path: Path) -> None:
+        """
+        Write already encoded file contents.
+        
+        Args:
+            data: Encoded image (e.g. from encode_png_rgba)
+            path: Destination path
+        
+        Raises:
+            IOError: If save fails
+        """
+        pass
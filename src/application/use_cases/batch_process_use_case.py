@@ -1,13 +1,18 @@
 """Batch processing use case."""
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, replace
+from typing import List, Optional
 import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
 from concurrent.futures import ThreadPoolExecutor
 import time
 
 from ..ports.background_removal_engine import BackgroundRemovalEngine
 from ..ports.image_io import ImageIO
+from ...domain.entities.image_input import ImageInput
 from ...domain.entities.image_output import ImageOutput
 from ...domain.entities.settings import Settings
 from .remove_background_use_case import RemoveBackgroundUseCase, RemoveBackgroundResult
@@ -46,6 +51,8 @@ class BatchResult:
     results: List[RemoveBackgroundResult]
     errors: List[tuple[Path, str]]  # (file_path, error_message)
     total_time_ms: float
+    cached: int = 0  # Successful images copied from the result cache (not in `results`)
+    summary_text: str = ""  # Pre-formatted summary, filled in by the caller's worker
     
     @property
     def success_rate(self) -> float:
@@ -56,12 +63,16 @@ class BatchResult:
 class BatchProcessUseCase:
     """Use case for batch processing multiple images."""
     
+    CACHE_MAX_BYTES = 2 << 30  # Cached outputs kept, least recently used dropped first
+    CACHE_TTL_S = 30 * 24 * 3600  # Cached outputs unused this long are dropped
+    
     def __init__(
         self,
         engine: BackgroundRemovalEngine,
         image_io: ImageIO,
         settings: Settings,
-        max_workers: int = 4
+        max_workers: Optional[int] = None,
+        cache_folder: Optional[Path] = None
     ):
         """
         Initialize batch process use case.
@@ -70,13 +81,25 @@ class BatchProcessUseCase:
             engine: Background removal engine
             image_io: Image I/O adapter
             settings: Application settings
-            max_workers: Maximum concurrent workers
+            max_workers: Maximum concurrent workers (default: up to 4, one per CPU core)
+            cache_folder: Folder for outputs keyed by input content hash (None = no
+                          cache); pruned to CACHE_MAX_BYTES / CACHE_TTL_S after each
+                          batch, emptied by clear_cache()
         """
         self.engine = engine
         self.image_io = image_io
         self.settings = settings
-        self.max_workers = max_workers
-        self.use_case = RemoveBackgroundUseCase(engine, image_io, settings)
+        # Threads, not processes: ONNX Runtime releases the GIL during inference and
+        # Pillow/cv2 during decode/encode, while a process pool would need its own
+        # copy of the model session in every worker
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.io_workers = 2  # Decode / encode threads
+        self.prefetch = 8  # Images decoded ahead of inference
+        self.cache_folder = cache_folder
+        
+        # Images finished in the running batch; safe to poll from another thread
+        # (single int store) instead of passing a per-image progress_callback
+        self.processed = 0
     
     async def execute(
         self,
@@ -96,6 +119,12 @@ class BatchProcessUseCase:
             BatchResult with statistics
         """
         start_time = time.perf_counter()
+        self.processed = 0
+        
+        # Snapshot: the settings object may be shared with a UI whose sliders keep
+        # changing it, and the cache key must match what every image is computed with
+        settings = replace(self.settings)
+        use_case = RemoveBackgroundUseCase(self.engine, self.image_io, settings)
         
         # Ensure output folder exists
         output_folder.mkdir(parents=True, exist_ok=True)
@@ -103,43 +132,114 @@ class BatchProcessUseCase:
         total = len(image_paths)
         completed = 0
         failed = 0
+        cached = 0
         results = []
         errors = []
         
-        # Process images with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            
-            for image_path in image_paths:
-                future = executor.submit(
-                    self._process_single,
-                    image_path,
-                    output_folder
-                )
-                futures.append((image_path, future))
-            
-            # Collect results
-            for image_path, future in futures:
-                elapsed = (time.perf_counter() - start_time) * 1000
-                
-                # Update progress
-                if progress_callback:
-                    progress = BatchProgress(
-                        total=total,
-                        completed=completed,
-                        failed=failed,
-                        current_file=str(image_path.name),
-                        elapsed_time_ms=elapsed
+        # Three-stage pipeline: decode threads prefetch ahead of inference, and PNG
+        # encoding runs on its own threads so it overlaps the next inference
+        loop = asyncio.get_running_loop()
+        read_pool = ThreadPoolExecutor(max_workers=self.io_workers)
+        compute_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        write_pool = ThreadPoolExecutor(max_workers=self.io_workers)
+        
+        # Holds (path, decode future) pairs; bounded so at most `prefetch` images
+        # are decoded ahead of inference
+        decoded = asyncio.Queue(maxsize=self.prefetch)
+        write_tasks = []
+        
+        # Unchanged input + same model and settings -> reuse the previous output
+        params_key = None
+        if self.cache_folder is not None:
+            self.cache_folder.mkdir(parents=True, exist_ok=True)
+            params_key = self._params_key(settings)
+        
+        async def produce():
+            ordered = await loop.run_in_executor(read_pool, self._largest_first, image_paths)
+            for image_path in ordered:
+                load = loop.run_in_executor(read_pool, self._load_sync, image_path, params_key)
+                await decoded.put((image_path, load))
+            for _ in range(self.max_workers):
+                await decoded.put(None)
+        
+        async def write_and_record(
+            image_path: Path,
+            result: Optional[RemoveBackgroundResult],
+            cache_key: Optional[str]
+        ):
+            nonlocal completed, failed, cached
+            output_path = output_folder / f"{image_path.stem}_nobg.png"
+            try:
+                if result is None:
+                    # Cache hit: copy the stored output instead of encoding
+                    await loop.run_in_executor(
+                        write_pool, shutil.copyfile, self._cache_path(cache_key), output_path
+                    )
+                    cached += 1
+                else:
+                    await loop.run_in_executor(
+                        write_pool, self._save_sync, result, output_path, cache_key
                     )
-                    await progress_callback(progress)
+                    results.append(result)
+                completed += 1
+            except Exception as e:
+                errors.append((image_path, str(e)))
+                failed += 1
+            await report(image_path)
+        
+        async def consume():
+            nonlocal failed
+            while True:
+                item = await decoded.get()
+                if item is None:
+                    break
                 
+                image_path, load = item
                 try:
-                    result = future.result()
-                    results.append(result)
-                    completed += 1
+                    cache_key, image_input = await load
+                    result = None
+                    if image_input is not None:
+                        result = await loop.run_in_executor(
+                            compute_pool, self._compute_sync, use_case, image_input
+                        )
                 except Exception as e:
                     errors.append((image_path, str(e)))
                     failed += 1
+                    await report(image_path)
+                    continue
+                
+                # Don't wait for the encode - start the next inference right away
+                write_tasks.append(
+                    asyncio.ensure_future(write_and_record(image_path, result, cache_key))
+                )
+        
+        async def report(image_path: Path):
+            # Progress counts an image once its output is on disk (or it failed)
+            self.processed = completed + failed
+            if progress_callback:
+                elapsed = (time.perf_counter() - start_time) * 1000
+                progress = BatchProgress(
+                    total=total,
+                    completed=completed,
+                    failed=failed,
+                    current_file=str(image_path.name),
+                    elapsed_time_ms=elapsed
+                )
+                await progress_callback(progress)
+        
+        stages = [asyncio.ensure_future(produce())]
+        stages += [asyncio.ensure_future(consume()) for _ in range(self.max_workers)]
+        try:
+            await asyncio.gather(*stages)
+            await asyncio.gather(*write_tasks)
+            if self.cache_folder is not None:
+                await loop.run_in_executor(write_pool, self._prune_cache)
+        finally:
+            # On cancellation stop every stage and drop queued work instead of waiting
+            for task in stages + write_tasks:
+                task.cancel()
+            for pool in (read_pool, compute_pool, write_pool):
+                pool.shutdown(wait=False, cancel_futures=True)
         
         end_time = time.perf_counter()
         total_time = (end_time - start_time) * 1000
@@ -150,37 +250,145 @@ class BatchProcessUseCase:
             failed=failed,
             results=results,
             errors=errors,
-            total_time_ms=total_time
+            total_time_ms=total_time,
+            cached=cached
         )
     
-    def _process_single(self, image_path: Path, output_folder: Path) -> RemoveBackgroundResult:
+    def _load_sync(
+        self,
+        image_path: Path,
+        params_key: Optional[bytes]
+    ) -> tuple[Optional[str], Optional[ImageInput]]:
+        """
+        Hash and decode image (runs in the read pool).
+        
+        Returns:
+            (cache key or None, decoded image or None on cache hit)
         """
-        Process single image (runs in thread pool).
+        if params_key is None:
+            return None, asyncio.run(self.image_io.load_image(image_path))
+        
+        # Hash and (on a miss) decode the same bytes, so the file is read only once
+        data = image_path.read_bytes()
+        cache_key = hashlib.blake2b(data, digest_size=16, key=params_key).hexdigest()
+        cache_path = self._cache_path(cache_key)
+        if cache_path.exists():
+            try:
+                os.utime(cache_path)  # Mark as recently used for pruning
+            except OSError:
+                pass
+            return cache_key, None
+        
+        return cache_key, asyncio.run(self.image_io.load_image_bytes(data, image_path))
+    
+    @staticmethod
+    def _compute_sync(
+        use_case: RemoveBackgroundUseCase,
+        image_input: ImageInput
+    ) -> RemoveBackgroundResult:
+        """Run inference and post-processing (runs in the compute pool)."""
+        return asyncio.run(use_case.execute_image(image_input))
+    
+    def _save_sync(
+        self,
+        result: RemoveBackgroundResult,
+        output_path: Path,
+        cache_key: Optional[str]
+    ) -> None:
+        """Encode and write PNG, then store it in the cache (runs in the write pool)."""
+        asyncio.run(self.image_io.save_png_rgba(result.output, output_path))
+        
+        if cache_key is not None:
+            # Copy under a temporary name and rename into place, so a copy cut short
+            # by a crash never sits at <key>.png where it would count as a hit
+            fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=self.cache_folder)
+            os.close(fd)
+            try:
+                shutil.copyfile(output_path, tmp_name)
+                os.replace(tmp_name, self._cache_path(cache_key))
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)  # Cache is best effort
+    
+    @staticmethod
+    def _largest_first(image_paths: List[Path]) -> List[Path]:
+        """
+        Order paths by file size, largest first.
+        
+        Workers pull from a shared queue, so starting the heavy images early
+        (LPT order) leaves the small ones to even out the tail instead of one
+        worker finishing a huge photo while the others sit idle.
         
         Args:
-            image_path: Input image path
-            output_folder: Output folder
-            
+            image_paths: Input image paths
+        
         Returns:
-            RemoveBackgroundResult
+            Paths sorted by descending size (unreadable files last)
         """
-        # Run async use case in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        def size(path: Path) -> int:
+            try:
+                return os.stat(path).st_size
+            except OSError:
+                return -1
         
-        try:
-            # Execute removal
-            result = loop.run_until_complete(
-                self.use_case.execute(image_path)
-            )
-            
-            # Save output
-            output_path = output_folder / f"{image_path.stem}_nobg.png"
-            loop.run_until_complete(
-                self.image_io.save_png_rgba(result.output, output_path)
-            )
-            
-            return result
-            
-        finally:
-            loop.close()
+        return sorted(image_paths, key=size, reverse=True)
+    
+    def _cache_path(self, cache_key: str) -> Path:
+        """Cached output path for a content key."""
+        return self.cache_folder / f"{cache_key}.png"
+    
+    def clear_cache(self) -> None:
+        """Delete every cached batch output."""
+        if self.cache_folder is not None:
+            for pattern in ("*.png", "*.tmp"):
+                for entry in self.cache_folder.glob(pattern):
+                    entry.unlink(missing_ok=True)
+    
+    def _prune_cache(self) -> None:
+        """
+        Keep the cache bounded (runs after each batch).
+        
+        Drops outputs not used for CACHE_TTL_S, then the least recently used ones
+        until the rest fit in CACHE_MAX_BYTES. Hits refresh an entry's mtime, so
+        mtime order is use order. Temporary files left by an interrupted copy are
+        removed too.
+        """
+        for leftover in self.cache_folder.glob("*.tmp"):
+            try:
+                leftover.unlink()
+            except OSError:
+                pass
+        
+        entries = []
+        for entry in self.cache_folder.glob("*.png"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort(reverse=True)  # Most recently used first
+        
+        expiry = time.time() - self.CACHE_TTL_S
+        kept_bytes = 0
+        for mtime, size, entry in entries:
+            kept_bytes += size
+            if mtime < expiry or kept_bytes > self.CACHE_MAX_BYTES:
+                kept_bytes -= size
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass  # In use or already gone; next batch tries again
+    
+    @staticmethod
+    def _params_key(settings: Settings) -> bytes:
+        """Hash key for everything besides the input that affects the output."""
+        model_path = settings.model_path
+        model_mtime = model_path.stat().st_mtime_ns if model_path.exists() else 0
+        params = (
+            str(model_path),
+            model_mtime,
+            settings.threshold,
+            settings.smooth_pixels,
+            settings.feather_pixels,
+            settings.auto_crop_output
+        )
+        return hashlib.blake2b(repr(params).encode(), digest_size=32).digest()
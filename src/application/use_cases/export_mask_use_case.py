@@ -65,7 +65,7 @@ class ExportMaskUseCase:
         processed_mask = PostProcessMask.apply(mask, self.settings)
         
         # Step 4: Export as grayscale
-        output = MaskExporter.export_as_grayscale(processed_mask)
+        output = MaskExporter.export_as_grayscale(processed_mask, image_path)
         
         end_time = time.perf_counter()
         processing_time = (end_time - start_time) * 1000
@@ -103,7 +103,7 @@ class ExportMaskUseCase:
         processed_mask = PostProcessMask.apply(mask, self.settings)
         
         # Step 4: Export as binary
-        output = MaskExporter.export_as_binary(processed_mask, threshold)
+        output = MaskExporter.export_as_binary(processed_mask, image_path, threshold)
         
         end_time = time.perf_counter()
         processing_time = (end_time - start_time) * 1000
@@ -139,7 +139,7 @@ class ExportMaskUseCase:
         processed_mask = PostProcessMask.apply(mask, self.settings)
         
         # Step 4: Export as alpha
-        output = MaskExporter.export_as_alpha_only(processed_mask)
+        output = MaskExporter.export_as_alpha_only(processed_mask, image_path)
         
         end_time = time.perf_counter()
         processing_time = (end_time - start_time) * 1000
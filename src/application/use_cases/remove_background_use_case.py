@@ -6,6 +6,7 @@ import time
 
 from ..ports.background_removal_engine import BackgroundRemovalEngine
 from ..ports.image_io import ImageIO
+from ...domain.entities.image_input import ImageInput
 from ...domain.entities.image_output import ImageOutput
 from ...domain.entities.settings import Settings
 from ...domain.services.post_process_mask import PostProcessMask
@@ -67,6 +68,29 @@ class RemoveBackgroundUseCase:
         # Step 1: Load image
         image_input = await self.image_io.load_image(image_path)
         
+        return await self.execute_image(image_input, start_time)
+    
+    async def execute_image(
+        self,
+        image_input: ImageInput,
+        start_time: Optional[float] = None
+    ) -> RemoveBackgroundResult:
+        """
+        Execute background removal on an already loaded image.
+        
+        Args:
+            image_input: Decoded input image
+            start_time: perf_counter() value to measure from (default: now)
+        
+        Returns:
+            RemoveBackgroundResult with output and metadata
+        
+        Raises:
+            InferenceFailedError: If inference fails
+        """
+        if start_time is None:
+            start_time = time.perf_counter()
+        
         # Step 2: Predict mask
         raw_mask = await self.engine.predict_mask(image_input)
         
@@ -14,6 +14,9 @@ class Settings:
     # Model settings
     model_path: Path
     execution_provider: ExecutionProvider = "CPU"
+    cache_optimized_model: bool = False  # Save the fused graph next to the model, reuse it
+    intra_op_threads: int = 0  # CPU kernel threads, 0 = ONNX Runtime default
+    enable_profiling: bool = False  # Write an ONNX Runtime per-op JSON trace
     
     # Post-processing settings
     threshold: float = 0.5
@@ -38,6 +41,9 @@ class Settings:
         
         if self.feather_pixels < 0:
             raise ValueError("Feather pixels must be >= 0")
+        
+        if self.intra_op_threads < 0:
+            raise ValueError("Intra-op threads must be >= 0")
     
     @staticmethod
     def default() -> "Settings":
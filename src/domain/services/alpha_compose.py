@@ -1,4 +1,5 @@
 """Alpha composition service."""
+from typing import Optional
 import numpy as np
 from ..entities.image_input import ImageInput
 from ..entities.image_output import ImageOutput
@@ -9,13 +10,14 @@ class AlphaCompose:
     """Domain service for composing RGBA from RGB + mask."""
     
     @staticmethod
-    def compose(image: ImageInput, mask: Mask) -> ImageOutput:
+    def compose(image: ImageInput, mask: Mask, out: Optional[np.ndarray] = None) -> ImageOutput:
         """
         Compose RGBA image from RGB image and alpha mask.
         
         Args:
             image: Input RGB image
             mask: Alpha mask (0 = transparent, 1 = opaque)
+            out: Optional (H, W, 4) uint8 buffer to write into instead of allocating
             
         Returns:
             RGBA image with transparent background
@@ -27,21 +29,29 @@ class AlphaCompose:
                 f"mask size {(mask.height, mask.width)}"
             )
         
-        # Get RGB data
-        rgb = image.data  # (H, W, 3) uint8
+        if out is None:
+            out = np.empty((image.height, image.width, 4), dtype=np.uint8)
         
-        # Get alpha channel (0..1) and convert to uint8
-        alpha = (mask.data * 255).astype(np.uint8)  # (H, W)
-        
-        # Expand alpha to (H, W, 1) for concatenation
-        alpha_channel = alpha[:, :, np.newaxis]
-        
-        # Concatenate RGB + Alpha -> RGBA
-        rgba = np.concatenate([rgb, alpha_channel], axis=2)
+        # RGB straight across, alpha (0..1) scaled and truncated directly into the
+        # fourth channel - no float alpha image or concatenate temporary
+        out[:, :, :3] = image.data
+        AlphaCompose.write_alpha(mask, out)
         
         return ImageOutput(
-            data=rgba,
+            data=out,
             width=image.width,
             height=image.height,
             original_path=image.file_path
         )
+    
+    @staticmethod
+    def write_alpha(mask: Mask, out: np.ndarray) -> None:
+        """
+        Write mask into the alpha channel of an RGBA buffer, leaving RGB untouched.
+        
+        Args:
+            mask: Alpha mask (0 = transparent, 1 = opaque)
+            out: (H, W, 4) uint8 buffer whose RGB is already filled
+        """
+        # Alpha (0..1) scaled and truncated directly into the fourth channel
+        np.multiply(mask.data, 255, out=out[:, :, 3], casting='unsafe')
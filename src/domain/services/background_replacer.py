@@ -1,5 +1,6 @@
 """Background replacement service."""
 import numpy as np
+import cv2
 from typing import Tuple, Optional
 from pathlib import Path
 
@@ -34,30 +35,10 @@ class BackgroundReplacer:
         if mask.data.shape[:2] != (original.height, original.width):
             raise ValueError("Mask size must match image size")
         
-        # Get RGB data
-        rgb = original.data[:, :, :3].astype(np.float32)
-        
-        # Normalize mask to 0-1
-        alpha = mask.data.astype(np.float32)
-        if alpha.max() > 1.0:
-            alpha = alpha / 255.0
-        
-        # Ensure alpha is 2D
-        if alpha.ndim == 3:
-            alpha = alpha[:, :, 0]
-        
-        # Expand alpha to 3 channels
-        alpha_3ch = np.expand_dims(alpha, axis=2)
-        
-        # Create background with color
-        background = np.full_like(rgb, color, dtype=np.float32)
-        
-        # Composite: foreground * alpha + background * (1 - alpha)
-        result = rgb * alpha_3ch + background * (1 - alpha_3ch)
-        result = np.clip(result, 0, 255).astype(np.uint8)
-        
-        # Create RGBA output (with full alpha)
-        rgba = np.dstack([result, np.full((original.height, original.width), 255, dtype=np.uint8)])
+        # Composite over a constant color (broadcast, no background image)
+        rgba = BackgroundReplacer._composite(
+            original.data[:, :, :3], mask, np.array(color, dtype=np.uint16)
+        )
         
         return ImageOutput(
             data=rgba,
@@ -89,37 +70,18 @@ class BackgroundReplacer:
         if mask.data.shape[:2] != (original.height, original.width):
             raise ValueError("Mask size must match image size")
         
-        # Get RGB data
-        rgb = original.data[:, :, :3].astype(np.float32)
-        
-        # Normalize mask to 0-1
-        alpha = mask.data.astype(np.float32)
-        if alpha.max() > 1.0:
-            alpha = alpha / 255.0
-        
-        # Ensure alpha is 2D
-        if alpha.ndim == 3:
-            alpha = alpha[:, :, 0]
-        
-        # Expand alpha to 3 channels
-        alpha_3ch = np.expand_dims(alpha, axis=2)
-        
-        # Resize background to match original
-        import cv2
-        bg_data = background_image.data[:, :, :3].astype(np.float32)
+        # Resize background to match original. Resized in int16 so Lanczos
+        # overshoot past 0..255 survives into the blend and is clipped after it.
+        bg_data = np.ascontiguousarray(background_image.data[:, :, :3])
         if (background_image.height, background_image.width) != (original.height, original.width):
             bg_data = cv2.resize(
-                bg_data,
+                bg_data.astype(np.int16),
                 (original.width, original.height),
                 interpolation=cv2.INTER_LANCZOS4
             )
         
         # Composite: foreground * alpha + background * (1 - alpha)
-        result = rgb * alpha_3ch + bg_data * (1 - alpha_3ch)
-        result = np.clip(result, 0, 255).astype(np.uint8)
-        
-        # Create RGBA output (with full alpha)
-        rgba = np.dstack([result, np.full((original.height, original.width), 255, dtype=np.uint8)])
+        rgba = BackgroundReplacer._composite(original.data[:, :, :3], mask, bg_data)
         
         return ImageOutput(
             data=rgba,
@@ -147,8 +109,6 @@ class BackgroundReplacer:
         Returns:
             ImageOutput with blurred background
         """
-        import cv2
-        
         # Ensure mask is same size as image
         if mask.data.shape[:2] != (original.height, original.width):
             raise ValueError("Mask size must match image size")
@@ -157,34 +117,12 @@ class BackgroundReplacer:
         if blur_strength % 2 == 0:
             blur_strength += 1
         
-        # Get RGB data
-        rgb = original.data[:, :, :3].astype(np.float32)
-        
-        # Normalize mask to 0-1
-        alpha = mask.data.astype(np.float32)
-        if alpha.max() > 1.0:
-            alpha = alpha / 255.0
-        
-        # Ensure alpha is 2D
-        if alpha.ndim == 3:
-            alpha = alpha[:, :, 0]
-        
-        # Expand alpha to 3 channels
-        alpha_3ch = np.expand_dims(alpha, axis=2)
-        
         # Create blurred background
-        blurred = cv2.GaussianBlur(
-            rgb.astype(np.uint8),
-            (blur_strength, blur_strength),
-            0
-        ).astype(np.float32)
+        rgb = np.ascontiguousarray(original.data[:, :, :3])  # No copy for plain RGB
+        blurred = cv2.GaussianBlur(rgb, (blur_strength, blur_strength), 0)
         
         # Composite: foreground * alpha + blurred * (1 - alpha)
-        result = rgb * alpha_3ch + blurred * (1 - alpha_3ch)
-        result = np.clip(result, 0, 255).astype(np.uint8)
-        
-        # Create RGBA output (with full alpha)
-        rgba = np.dstack([result, np.full((original.height, original.width), 255, dtype=np.uint8)])
+        rgba = BackgroundReplacer._composite(rgb, mask, blurred)
         
         return ImageOutput(
             data=rgba,
@@ -192,3 +130,39 @@ class BackgroundReplacer:
             height=original.height,
             original_path=original_path or Path("output.png")
         )
+    
+    @staticmethod
+    def _composite(rgb: np.ndarray, mask: Mask, background) -> np.ndarray:
+        """
+        Blend foreground over background in integer math.
+        
+        Args:
+            rgb: Foreground (H, W, 3) uint8
+            mask: Foreground mask (0-1, float)
+            background: (H, W, 3) uint8 or int16 image, or (3,) color, broadcast against rgb
+        
+        Returns:
+            Opaque (H, W, 4) uint8 RGBA
+        """
+        # Alpha quantized to 0..255 (rounded, saturated) in one cv2 pass
+        alpha = cv2.convertScaleAbs(mask.data, alpha=255).astype(np.uint16)[:, :, None]
+        
+        if background.dtype == np.int16:
+            # Unclamped (resampled) background: blend in int32, clip afterwards
+            alpha = alpha.astype(np.int32)
+            blended = rgb * alpha
+            blended += (255 - alpha) * background
+            blended += 127
+            blended //= 255
+            np.clip(blended, 0, 255, out=blended)
+        else:
+            # (fg * a + bg * (255 - a) + 127) // 255 - exact rounding, max 65152 fits in uint16
+            blended = rgb * alpha
+            blended += (255 - alpha) * background
+            blended += 127
+            blended //= 255
+        
+        rgba = np.empty((rgb.shape[0], rgb.shape[1], 4), dtype=np.uint8)
+        rgba[:, :, :3] = blended
+        rgba[:, :, 3] = 255
+        return rgba
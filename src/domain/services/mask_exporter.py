@@ -1,5 +1,7 @@
 """Mask export service."""
+from pathlib import Path
 import numpy as np
+import cv2
 
 from ..entities.mask import Mask
 from ..entities.image_output import ImageOutput
@@ -9,84 +11,70 @@ class MaskExporter:
     """Service for exporting masks in various formats."""
     
     @staticmethod
-    def export_as_grayscale(mask: Mask) -> ImageOutput:
+    def export_as_grayscale(mask: Mask, original_path: Path) -> ImageOutput:
         """
         Export mask as grayscale PNG (0-255).
         
         Args:
             mask: Mask to export
+            original_path: Path of the source image
             
         Returns:
             ImageOutput with grayscale mask
         """
-        # Normalize mask to 0-255
-        mask_data = mask.data.astype(np.float32)
-        if mask_data.max() <= 1.0:
-            mask_data = mask_data * 255.0
-        
-        # Ensure 2D
-        if mask_data.ndim == 3:
-            mask_data = mask_data[:, :, 0]
-        
-        mask_uint8 = np.clip(mask_data, 0, 255).astype(np.uint8)
-        
-        # Convert to RGB (grayscale)
-        rgb = np.stack([mask_uint8, mask_uint8, mask_uint8], axis=2)
+        # Mask data is already 2D float in 0..1, so scale straight to uint8
+        mask_uint8 = mask.as_uint8()
         
-        # Add alpha channel (full opacity)
-        rgba = np.dstack([rgb, np.full_like(mask_uint8, 255)])
+        # Gray -> RGB copies plus opaque alpha in one pass
+        rgba = cv2.cvtColor(mask_uint8, cv2.COLOR_GRAY2RGBA)
         
         return ImageOutput(
             data=rgba,
             width=mask.width,
             height=mask.height,
-            format="RGBA"
+            original_path=original_path
         )
     
     @staticmethod
-    def export_as_binary(mask: Mask, threshold: float = 0.5) -> ImageOutput:
+    def export_as_binary(
+        mask: Mask,
+        original_path: Path,
+        threshold: float = 0.5
+    ) -> ImageOutput:
         """
         Export mask as binary black/white PNG.
         
         Args:
             mask: Mask to export
+            original_path: Path of the source image
             threshold: Threshold for binarization (0-1)
             
         Returns:
             ImageOutput with binary mask
         """
-        # Normalize mask to 0-1
-        mask_data = mask.data.astype(np.float32)
-        if mask_data.max() > 1.0:
-            mask_data = mask_data / 255.0
-        
-        # Ensure 2D
-        if mask_data.ndim == 3:
-            mask_data = mask_data[:, :, 0]
-        
-        # Binarize
-        binary = (mask_data >= threshold).astype(np.uint8) * 255
-        
-        # Convert to RGB
-        rgb = np.stack([binary, binary, binary], axis=2)
+        # Binarize straight to 0/255 uint8 (same >= rule as Mask.threshold),
+        # without the bool and int intermediates of a NumPy comparison
+        mask_data = mask.data if mask.data.dtype == np.float32 else mask.data.astype(np.float32)
+        binary = cv2.compare(mask_data, float(threshold), cv2.CMP_GE)
         
-        # Add alpha channel (full opacity)
-        rgba = np.dstack([rgb, np.full_like(binary, 255)])
+        # Gray -> RGB copies plus opaque alpha in one pass
+        rgba = cv2.cvtColor(binary, cv2.COLOR_GRAY2RGBA)
         
         return ImageOutput(
             data=rgba,
             width=mask.width,
             height=mask.height,
-            format="RGBA"
+            original_path=original_path
         )
     
     @staticmethod
-    def export_as_alpha_only(mask: Mask) -> ImageOutput:
+    def export_as_alpha_only(mask: Mask, original_path: Path) -> ImageOutput:
         """
         Export mask as alpha-only PNG (transparent = black, opaque = white).
         
         Args:
             mask: Mask to export
+            original_path: Path of the source image
             
         Returns:
             ImageOutput with alpha channel representing mask
@@ -110,5 +98,5 @@ class MaskExporter:
             data=rgba,
             width=mask.width,
             height=mask.height,
-            format="RGBA"
+            original_path=original_path
         )
@@ -1,4 +1,5 @@
 """Post-process mask service."""
+from functools import lru_cache
 import numpy as np
 import cv2
 from ..entities.mask import Mask
@@ -20,38 +21,44 @@ class PostProcessMask:
         Returns:
             Processed mask
         """
-        processed_data = mask.data.copy()
+        processed_data = mask.data
+        mask_uint8 = None  # uint8 working copy, kept across the cv2 steps
         
-        # 1. Threshold if not already binary
+        # 1. Threshold if not already binary, straight to 0/255 uint8 in one
+        # vectorized pass (no bool / float32 intermediates)
         if not mask.is_binary and settings.threshold > 0:
-            processed_data = (processed_data >= settings.threshold).astype(np.float32)
+            mask_uint8 = cv2.compare(
+                PostProcessMask._as_float32(processed_data), float(settings.threshold), cv2.CMP_GE
+            )
         
         # 2. Morphological smoothing (remove noise)
         if settings.smooth_pixels > 0:
-            kernel_size = settings.smooth_pixels * 2 + 1
-            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (kernel_size, kernel_size))
+            kernel = PostProcessMask._ellipse_kernel(settings.smooth_pixels * 2 + 1)
             
-            # Convert to uint8 for morphological operations
-            mask_uint8 = (processed_data * 255).astype(np.uint8)
+            # Convert to uint8 for morphological operations (already done if thresholded)
+            if mask_uint8 is None:
+                mask_uint8 = (processed_data * 255).astype(np.uint8)
             
             # Open (erosion + dilation) to remove small noise
             mask_uint8 = cv2.morphologyEx(mask_uint8, cv2.MORPH_OPEN, kernel, iterations=1)
             
             # Close (dilation + erosion) to fill small holes
             mask_uint8 = cv2.morphologyEx(mask_uint8, cv2.MORPH_CLOSE, kernel, iterations=1)
-            
-            processed_data = mask_uint8.astype(np.float32) / 255.0
         
         # 3. Feathering (edge blur for smooth transition)
         if settings.feather_pixels > 0:
-            # Convert to uint8
-            mask_uint8 = (processed_data * 255).astype(np.uint8)
+            # Convert to uint8 (already done if thresholded or smoothed)
+            if mask_uint8 is None:
+                mask_uint8 = (processed_data * 255).astype(np.uint8)
             
             # Gaussian blur for soft edges
             kernel_size = settings.feather_pixels * 2 + 1
-            blurred = cv2.GaussianBlur(mask_uint8, (kernel_size, kernel_size), 0)
-            
-            processed_data = blurred.astype(np.float32) / 255.0
+            mask_uint8 = cv2.GaussianBlur(mask_uint8, (kernel_size, kernel_size), 0)
+        
+        if mask_uint8 is not None:
+            processed_data = np.divide(mask_uint8, 255, dtype=np.float32)
+        elif processed_data is mask.data:
+            processed_data = mask.data.copy()
         
         return Mask(
             data=processed_data,
@@ -59,3 +66,14 @@ class PostProcessMask:
             height=mask.height,
             is_binary=False  # After feathering, no longer strictly binary
         )
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _ellipse_kernel(kernel_size: int) -> np.ndarray:
+        """Get elliptical structuring element, cached per size (reused across slider ticks)."""
+        return cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (kernel_size, kernel_size))
+    
+    @staticmethod
+    def _as_float32(data: np.ndarray) -> np.ndarray:
+        """Return mask data as float32 (cv2 compares need a matching depth)."""
+        return data if data.dtype == np.float32 else data.astype(np.float32)
@@ -33,6 +33,9 @@ class OnnxBiRefNetEngine(BackgroundRemovalEngine):
         self.settings = settings
         self.enable_caching = enable_caching
         self.session: Optional[ort.InferenceSession] = None
+        self._input_name: Optional[str] = None
+        self._output_name: Optional[str] = None
+        self._cache_key: Optional[str] = None
         self.preprocessor = ImagePreprocessor(
             target_size=1024,
             mean=(0.485, 0.456, 0.406),
@@ -48,11 +51,17 @@ class OnnxBiRefNetEngine(BackgroundRemovalEngine):
             raise ModelNotFoundError(f"Model not found: {self.settings.model_path}")
         
         # Create cache key
-        cache_key = f"{self.settings.model_path}_{self.settings.execution_provider}"
+        cache_key = (
+            f"{self.settings.model_path}_{self.settings.execution_provider}"
+            f"_{self.settings.intra_op_threads}"
+        )
+        
+        self._cache_key = cache_key
         
         # Check cache first
         if self.enable_caching and cache_key in self._session_cache:
             self.session = self._session_cache[cache_key]
+            self._cache_io_names()
             logger.info(f"Reusing cached session for {cache_key}")
             return
         
@@ -74,12 +83,24 @@ class OnnxBiRefNetEngine(BackgroundRemovalEngine):
             sess_options.enable_mem_pattern = True
             sess_options.enable_cpu_mem_arena = True
             
+            # Single image at a time: ops run one after another, each spread over
+            # the intra-op pool
+            sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+            sess_options.inter_op_num_threads = 1
+            if self.settings.intra_op_threads > 0:
+                sess_options.intra_op_num_threads = self.settings.intra_op_threads
+            if self.settings.enable_profiling:
+                sess_options.enable_profiling = True
+            
+            model_path = self._resolve_model_path(provider, sess_options)
+            
             # Create session
             self.session = ort.InferenceSession(
-                str(self.settings.model_path),
+                str(model_path),
                 sess_options=sess_options,
-                providers=[provider]
+                providers=ProviderManager.build_providers(provider)
             )
+            self._cache_io_names()
             
             # Cache session if enabled
             if self.enable_caching:
@@ -90,6 +111,49 @@ class OnnxBiRefNetEngine(BackgroundRemovalEngine):
         except Exception as e:
             raise ModelNotFoundError(f"Failed to load model: {e}")
     
+    def _cache_io_names(self):
+        """Look up the model's input/output names once per session."""
+        self._input_name = self.session.get_inputs()[0].name
+        self._output_name = self.session.get_outputs()[0].name
+    
+    @property
+    def input_name(self) -> str:
+        """Name of the model's image input."""
+        return self._input_name
+    
+    @property
+    def output_name(self) -> str:
+        """Name of the model's mask output."""
+        return self._output_name
+    
+    def _resolve_model_path(self, provider: str, sess_options: ort.SessionOptions) -> Path:
+        """
+        Pick the model file to load, using the saved optimized graph when allowed.
+        
+        Args:
+            provider: ONNX Runtime provider name the session will use
+            sess_options: Session options, adjusted in place
+        
+        Returns:
+            Path to the original model, or to its cached optimized copy
+        """
+        model_path = self.settings.model_path
+        
+        # ORT_ENABLE_ALL output can contain provider-specific fused nodes, so only the
+        # CPU graph is safe to persist and reload
+        if not self.settings.cache_optimized_model or provider != "CPUExecutionProvider":
+            return model_path
+        
+        optimized_path = model_path.with_name(f"{model_path.stem}.cpu.opt.onnx")
+        if optimized_path.exists() and optimized_path.stat().st_mtime >= model_path.stat().st_mtime:
+            # Fused on an earlier run - load as-is instead of re-running the optimizers
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            logger.info(f"Loading optimized model {optimized_path}")
+            return optimized_path
+        
+        sess_options.optimized_model_filepath = str(optimized_path)
+        return model_path
+    
     async def remove_background(self, image: ImageInput) -> Mask:
         """
         Remove background from image.
@@ -108,14 +172,10 @@ class OnnxBiRefNetEngine(BackgroundRemovalEngine):
             # Preprocess image
             input_tensor, original_size = self.preprocessor.preprocess(image.data)
             
-            # Get input/output names
-            input_name = self.session.get_inputs()[0].name
-            output_name = self.session.get_outputs()[0].name
-            
             # Run inference
             outputs = self.session.run(
-                [output_name],
-                {input_name: input_tensor}
+                [self._output_name],
+                {self._input_name: input_tensor}
             )
             
             # Get mask output
@@ -148,13 +208,10 @@ class OnnxBiRefNetEngine(BackgroundRemovalEngine):
             logger.info("Warming up ONNX session...")
             
             # Create dummy input
-            input_name = self.session.get_inputs()[0].name
-            output_name = self.session.get_outputs()[0].name
-            
             dummy_input = np.random.randn(1, 3, warmup_size, warmup_size).astype(np.float32)
             
             # Run dummy inference
-            _ = self.session.run([output_name], {input_name: dummy_input})
+            _ = self.session.run([self._output_name], {self._input_name: dummy_input})
             
             self.is_warmed_up = True
             logger.info("Warm-up complete")
@@ -162,6 +219,22 @@ class OnnxBiRefNetEngine(BackgroundRemovalEngine):
         except Exception as e:
             logger.warning(f"Warm-up failed: {e}")
     
+    def close(self):
+        """
+        Release the session now instead of whenever it is garbage collected.
+        
+        Also drops it from the session cache, so its device memory (VRAM on GPU
+        providers) is freed before another session is created.
+        """
+        if self.session is None:
+            return
+        
+        if self._session_cache.get(self._cache_key) is self.session:
+            del self._session_cache[self._cache_key]
+        self.session = None
+        self.is_warmed_up = False
+        logger.info(f"Released session for {self._cache_key}")
+    
     @classmethod
     def clear_cache(cls):
         """Clear the session cache."""
@@ -1,11 +1,25 @@
 """ONNX Runtime provider utilities."""
-from typing import List, Dict
+from typing import List, Dict, Tuple, Union
 import onnxruntime as ort
 
 
 class ProviderManager:
     """Manage ONNX Runtime execution providers."""
     
+    # Per-provider options passed to InferenceSession
+    PROVIDER_OPTIONS = {
+        "CUDAExecutionProvider": {
+            "device_id": 0,
+            # EXHAUSTIVE (the default) benchmarks every conv algorithm on the first
+            # run, adding seconds of latency for BiRefNet's large convolutions
+            "cudnn_conv_algo_search": "DEFAULT",
+            "arena_extend_strategy": "kSameAsRequested",
+        },
+        "DmlExecutionProvider": {
+            "device_id": 0,
+        },
+    }
+    
     @staticmethod
     def get_available_providers() -> List[str]:
         """
@@ -109,3 +123,21 @@ class ProviderManager:
         """
         ort_provider = ProviderManager.map_provider_name(provider_name)
         return ort_provider in ort.get_available_providers()
+    
+    @staticmethod
+    def build_providers(ort_provider: str) -> List[Union[str, Tuple[str, Dict]]]:
+        """
+        Build the providers list for an InferenceSession.
+        
+        Args:
+            ort_provider: ONNX Runtime provider name (CPUExecutionProvider, etc.)
+        
+        Returns:
+            Provider with its options, followed by CPU for any ops the GPU provider
+            can't run
+        """
+        if ort_provider == "CPUExecutionProvider":
+            return [ort_provider]
+        
+        options = ProviderManager.PROVIDER_OPTIONS.get(ort_provider, {})
+        return [(ort_provider, options), "CPUExecutionProvider"]
@@ -1,4 +1,5 @@
 """Local image I/O implementation using Pillow."""
+import io
 from pathlib import Path
 from PIL import Image
 import numpy as np
@@ -13,21 +14,42 @@ class LocalImageIO(ImageIO):
     """Image I/O using Pillow (PIL)."""
     
     SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.webp', '.bmp'}
+    WRITE_BUFFER_SIZE = 1 << 20  # 1MB, fewer syscalls on slow/network drives
     
     async def load_image(self, path: Path) -> ImageInput:
         """Load image from file."""
         if not path.exists():
             raise FileNotFoundError(f"Image file not found: {path}")
         
+        self._check_format(path)
+        
+        try:
+            # Read the whole file in one syscall instead of Pillow's many small
+            # buffered reads, then decode from memory
+            data = path.read_bytes()
+        except Exception as e:
+            raise InvalidImageError(f"Failed to load image {path}: {e}")
+        
+        return self._decode(data, path)
+    
+    async def load_image_bytes(self, data: bytes, path: Path) -> ImageInput:
+        """Decode image from file contents already in memory."""
+        self._check_format(path)
+        return self._decode(data, path)
+    
+    def _check_format(self, path: Path) -> None:
+        """Reject file types Pillow decoding isn't set up for."""
         if path.suffix.lower() not in self.SUPPORTED_FORMATS:
             raise InvalidImageError(
                 f"Unsupported format {path.suffix}. "
                 f"Supported: {', '.join(self.SUPPORTED_FORMATS)}"
             )
-        
+    
+    @staticmethod
+    def _decode(data: bytes, path: Path) -> ImageInput:
+        """Decode encoded bytes into an RGB ImageInput."""
         try:
-            # Load image with Pillow
-            pil_image = Image.open(path)
+            pil_image = Image.open(io.BytesIO(data))
             
             # Convert to RGB (handle RGBA, L, etc.)
             if pil_image.mode != 'RGB':
@@ -55,10 +77,62 @@ class LocalImageIO(ImageIO):
             path.parent.mkdir(parents=True, exist_ok=True)
             
             # Convert numpy array to PIL Image
-            pil_image = Image.fromarray(output.data, mode='RGBA')
+            pil_image = self._to_pil_rgba(output.data)
             
-            # Save as PNG (PNG supports transparency)
-            pil_image.save(path, format='PNG', optimize=True)
+            # Save as PNG (PNG supports transparency), streaming
+            # compressed chunks through a large write buffer
+            with open(path, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                pil_image.save(f, format='PNG', compress_level=1)
+        
+        except Exception as e:
+            raise IOError(f"Failed to save image to {path}: {e}")
+    
+    @staticmethod
+    def _to_pil_rgba(data: np.ndarray) -> Image.Image:
+        """Wrap RGBA array as PIL Image, reading contiguous buffers in one chunk."""
+        if data.flags.c_contiguous and data.dtype == np.uint8 and data.shape[2] == 4:
+            height, width = data.shape[:2]
+            return Image.frombuffer('RGBA', (width, height), data, 'raw', 'RGBA', 0, 1)
+        
+        return Image.fromarray(data, mode='RGBA')
+    
+    async def save_png_1bit(self, mask: np.ndarray, path: Path) -> None:
+        """Save boolean mask as 1-bit PNG (much smaller than RGBA)."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            pil_image = self._to_pil_1bit(mask)
             
+            # Two-color data compresses well even at the fastest level
+            with open(path, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                pil_image.save(f, format='PNG', optimize=False, compress_level=1)
+            
+        except Exception as e:
+            raise IOError(f"Failed to save image to {path}: {e}")
+    
+    @staticmethod
+    def _to_pil_1bit(mask: np.ndarray) -> Image.Image:
+        """Boolean mask as a 1-bit PIL Image."""
+        # 0/255 grayscale -> 1-bit (no dithering needed for pure black/white)
+        gray = mask.view(np.uint8) * 255
+        return Image.fromarray(gray).convert('1', dither=Image.Dither.NONE)
+    
+    async def encode_png_rgba(self, output: ImageOutput) -> bytes:
+        """Encode RGBA image as PNG bytes (same settings as save_png_rgba)."""
+        buffer = io.BytesIO()
+        self._to_pil_rgba(output.data).save(buffer, format='PNG', compress_level=1)
+        return buffer.getvalue()
+    
+    async def encode_png_1bit(self, mask: np.ndarray) -> bytes:
+        """Encode boolean mask as 1-bit PNG bytes (same settings as save_png_1bit)."""
+        buffer = io.BytesIO()
+        self._to_pil_1bit(mask).save(buffer, format='PNG', optimize=False, compress_level=1)
+        return buffer.getvalue()
+    
+    async def save_bytes(self, data: bytes, path: Path) -> None:
+        """Write already encoded file contents in one call."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
         except Exception as e:
             raise IOError(f"Failed to save image to {path}: {e}")
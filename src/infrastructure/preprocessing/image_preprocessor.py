@@ -1,7 +1,7 @@
 """Image preprocessing utilities."""
 import numpy as np
 import cv2
-from typing import Tuple
+from typing import Optional, Tuple
 
 
 class ImagePreprocessor:
@@ -28,16 +28,22 @@ class ImagePreprocessor:
         self.std = np.array(std, dtype=np.float32).reshape(1, 1, 3)
         self.normalize = normalize
     
-    def preprocess(self, image: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+    def preprocess(
+        self,
+        image: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Tuple[int, int]]:
         """
         Preprocess image for model input.
         
         Args:
             image: Input image (H, W, 3) uint8 RGB
+            out: Optional (1, 3, target, target) float32 buffer to write into
+                 instead of allocating (reused across calls by benchmarks)
             
         Returns:
             Tuple of:
-                - Preprocessed tensor (1, 3, H, W) float32 NCHW
+                - Preprocessed tensor (1, 3, H, W) float32 NCHW, C-contiguous
                 - Original size (height, width)
         """
         original_size = image.shape[:2]  # (H, W)
@@ -49,28 +55,34 @@ class ImagePreprocessor:
             interpolation=cv2.INTER_LINEAR
         )
         
-        # Convert to float32 and scale to [0, 1]
-        image_float = resized.astype(np.float32) / 255.0
-        
-        # Normalize if enabled
-        if self.normalize:
-            image_float = (image_float - self.mean) / self.std
+        if out is None:
+            out = np.empty((1, 3, self.target_size, self.target_size), dtype=np.float32)
         
-        # Convert HWC -> CHW
-        image_chw = np.transpose(image_float, (2, 0, 1))
+        # HWC -> NCHW one channel plane at a time, straight into the output: scale to
+        # [0, 1], then normalize in place (same float32 ops as the whole-image version)
+        for c in range(3):
+            plane = out[0, c]
+            np.divide(resized[:, :, c], np.float32(255.0), out=plane)
+            if self.normalize:
+                plane -= self.mean[0, 0, c]
+                plane /= self.std[0, 0, c]
         
-        # Add batch dimension: CHW -> NCHW
-        image_nchw = np.expand_dims(image_chw, axis=0)
-        
-        return image_nchw, original_size
+        return out, original_size
     
-    def postprocess_mask(self, mask: np.ndarray, original_size: Tuple[int, int]) -> np.ndarray:
+    def postprocess_mask(
+        self,
+        mask: np.ndarray,
+        original_size: Tuple[int, int],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Postprocess mask output from model.
         
         Args:
             mask: Model output mask (1, 1, H, W) or (1, H, W) or (H, W)
             original_size: Original image size (height, width)
+            out: Optional (H, W) float32 buffer to write into instead of
+                 allocating (reused across calls by benchmarks)
             
         Returns:
             Resized mask (H, W) float32 [0, 1]
@@ -88,12 +100,13 @@ class ImagePreprocessor:
         # Resize back to original size
         h, w = original_size
         mask_resized = cv2.resize(
-            mask,
+            mask.astype(np.float32, copy=False),
             (w, h),
+            dst=out,
             interpolation=cv2.INTER_LINEAR
         )
         
         # Clip to [0, 1]
-        mask_resized = np.clip(mask_resized, 0.0, 1.0)
+        np.clip(mask_resized, 0.0, 1.0, out=mask_resized)
         
-        return mask_resized.astype(np.float32)
+        return mask_resized
@@ -1,26 +1,39 @@
 """Main window for RemoveBG application."""
 import asyncio
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List
 
+import numpy as np
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QStatusBar,
     QGroupBox, QSlider, QRadioButton, QButtonGroup,
-    QLineEdit, QMessageBox, QCheckBox, QToolBar, QProgressBar
+    QLineEdit, QMessageBox, QCheckBox, QToolBar, QProgressBar, QToolButton,
+    QDialog, QDialogButtonBox, QColorDialog
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap, QImage, QAction
+from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtGui import QPixmap, QImage, QImageReader, QAction, QDesktopServices, QColor
 
 from src.ui.widgets.image_preview import ImagePreviewWidget
 from src.ui.view_models.main_view_model import MainViewModel
 from src.domain.entities.settings import Settings
+from src.domain.services.post_process_mask import PostProcessMask
+from src.domain.services.alpha_compose import AlphaCompose
+from src.application.use_cases.export_mask_use_case import ExportMaskUseCase
 from src.infrastructure.engines.provider_manager import ProviderManager
+from src.infrastructure.image_io.local_image_io import LocalImageIO
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    EXPORT_CACHE_SIZE = 4  # Number of encoded mask PNGs kept in memory
+    PROGRESS_INTERVAL_S = 0.1  # Minimum time between batch progress text updates
+    _EXPORT_MSG = "Mask saved: {f} ({t:.0f}ms)"
+    
     def __init__(self, view_model: MainViewModel):
         """Initialize main window."""
         super().__init__()
@@ -28,8 +41,14 @@ class MainWindow(QMainWindow):
         self.input_image_path: Optional[Path] = None
         self.output_image_path: Optional[Path] = None
         self.background_image_path: Optional[Path] = None
+        self.last_mask_path: Optional[Path] = None
+        self._export_cache: OrderedDict = OrderedDict()  # LRU of (png bytes, processing ms)
+        self._format_dialog: Optional[QDialog] = None
+        self._format_radios: dict = {}
+        self._last_format_type = "grayscale"
         self.bg_color = None  # None = transparent, tuple = color
         self.transparent_result = None  # Store transparent RGBA result for compositing
+        self._opaque_out = None  # Reused (H, W, 4) buffer for color preview, alpha = 255
         self.raw_mask = None  # Store raw mask from AI (before post-processing)
         self.original_image = None  # Store original ImageInput for reprocessing
         
@@ -63,6 +82,14 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
+        
+        # Reveal last exported mask (hidden until a mask is saved)
+        self.action_reveal_mask = QAction("Show in Folder", self)
+        self.action_reveal_mask.triggered.connect(self._on_reveal_mask)
+        self.btn_reveal_mask = QToolButton()
+        self.btn_reveal_mask.setDefaultAction(self.action_reveal_mask)
+        self.btn_reveal_mask.hide()
+        self.status_bar.addPermanentWidget(self.btn_reveal_mask)
     
     def _create_toolbar(self) -> QHBoxLayout:
         """Create top toolbar with action buttons."""
@@ -347,8 +374,10 @@ class MainWindow(QMainWindow):
             # Always remove background to transparent
             result = await self.view_model.remove_background(self.input_image_path)
             
-            # Store raw data for real-time reprocessing
-            self.transparent_result = result.output.data.copy()
+            # Store raw data for real-time reprocessing; the result is only read
+            # (previews composite into _opaque_out), so share it read-only
+            self.transparent_result = result.output.data
+            self.transparent_result.flags.writeable = False
             self.raw_mask = result.raw_mask
             self.original_image = result.original_image
             
@@ -524,13 +553,14 @@ class MainWindow(QMainWindow):
         if not output_folder:
             return
         
-        # Find all image files
-        input_path = Path(input_folder)
-        image_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.bmp'}
-        image_files = [
-            f for f in input_path.iterdir()
-            if f.suffix.lower() in image_extensions
-        ]
+        # Find all image files (DirEntry avoids a stat and a Path per entry)
+        image_extensions = ('.jpg', '.jpeg', '.png', '.webp', '.bmp')
+        with os.scandir(input_folder) as entries:
+            image_files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.lower().endswith(image_extensions)
+            ]
         
         if not image_files:
             QMessageBox.warning(
@@ -557,15 +587,7 @@ class MainWindow(QMainWindow):
     
     async def _run_batch_process(self, image_files: List[Path], output_folder: Path):
         """Run batch processing."""
-        from src.application.use_cases.batch_process_use_case import BatchProcessUseCase
-        
-        # Create batch use case
-        batch_use_case = BatchProcessUseCase(
-            engine=self.view_model.use_case.engine,
-            image_io=self.view_model.use_case.image_io,
-            settings=self.view_model.settings,
-            max_workers=4
-        )
+        batch_use_case = self.view_model.get_batch_use_case()
         
         # Create progress dialog
         progress_dialog = QMessageBox(self)
@@ -574,8 +596,17 @@ class MainWindow(QMainWindow):
         progress_dialog.setStandardButtons(QMessageBox.StandardButton.NoButton)
         progress_dialog.show()
         
+        last_update = 0.0
+        
         async def progress_callback(progress):
-            """Update progress dialog."""
+            """Update progress dialog, at most ~10 times per second (always the last one)."""
+            nonlocal last_update
+            now = time.monotonic()
+            done = progress.completed + progress.failed >= progress.total
+            if now - last_update < self.PROGRESS_INTERVAL_S and not done:
+                return
+            last_update = now
+            
             progress_dialog.setText(
                 f"Processing: {progress.current_file}\n"
                 f"Completed: {progress.completed}/{progress.total}\n"
@@ -650,9 +681,6 @@ class MainWindow(QMainWindow):
     
     def _on_pick_color(self):
         """Handle pick color button - Update preview real-time."""
-        from PyQt6.QtWidgets import QColorDialog
-        from PyQt6.QtGui import QColor
-        
         # Get initial color
         initial_color = QColor(*self.bg_color) if self.bg_color else QColor(255, 255, 255)
         
@@ -684,31 +712,30 @@ class MainWindow(QMainWindow):
     
     def _update_preview_with_background(self):
         """Update preview with current background color or transparent."""
-        import numpy as np
-        
         if not hasattr(self, 'transparent_result'):
             return
         
-        rgba = self.transparent_result.copy()
+        rgba = self.transparent_result
         
         if self.bg_color is not None:
-            # Composite with solid color background
-            rgb = rgba[:, :, :3].astype(np.float32)
-            alpha = rgba[:, :, 3:4].astype(np.float32) / 255.0
-            
-            # Create background with color
-            bg_color = np.array(self.bg_color, dtype=np.float32)
-            background = np.full_like(rgb, bg_color)
+            # Composite with solid color background into the reused opaque buffer
+            # (alpha channel is filled once when the buffer is allocated)
+            if self._opaque_out is None or self._opaque_out.shape != rgba.shape:
+                self._opaque_out = np.empty(rgba.shape, dtype=np.uint8)
+                self._opaque_out[:, :, 3] = 255
             
-            # Composite: foreground * alpha + background * (1 - alpha)
-            result_rgb = rgb * alpha + background * (1 - alpha)
-            result_rgb = np.clip(result_rgb, 0, 255).astype(np.uint8)
+            # Composite: (fg * a + bg * (255 - a) + 127) // 255 in uint16, no float temporaries
+            alpha = rgba[:, :, 3:4].astype(np.uint16)
+            bg_color = np.array(self.bg_color, dtype=np.uint16)
             
-            # Create opaque RGBA
-            result = np.dstack([result_rgb, np.full((rgba.shape[0], rgba.shape[1]), 255, dtype=np.uint8)])
+            blended = rgba[:, :, :3] * alpha
+            blended += (255 - alpha) * bg_color
+            blended += 127
+            blended //= 255
+            self._opaque_out[:, :, :3] = blended
             
             # Display without checkerboard (solid background)
-            self.preview_output.set_image_from_array(result, use_checkerboard=False)
+            self.preview_output.set_image_from_array(self._opaque_out, use_checkerboard=False)
         else:
             # Display transparent with checkerboard
             use_checkerboard = self.chk_checkerboard.isChecked()
@@ -722,18 +749,15 @@ class MainWindow(QMainWindow):
         if not hasattr(self, 'original_image') or self.original_image is None:
             return
         
-        # Import necessary modules
-        from src.domain.services.post_process_mask import PostProcessMask
-        from src.domain.services.alpha_compose import AlphaCompose
-        
         # Re-apply post-processing with current settings
         processed_mask = PostProcessMask.apply(self.raw_mask, self.view_model.settings)
         
         # Compose new RGBA
         output = AlphaCompose.compose(self.original_image, processed_mask)
         
-        # Update transparent result
-        self.transparent_result = output.data.copy()
+        # Update transparent result (freshly composed, no copy needed)
+        self.transparent_result = output.data
+        self.transparent_result.flags.writeable = False
         
         # Update preview with current background color
         self._update_preview_with_background()
@@ -743,22 +767,36 @@ class MainWindow(QMainWindow):
         if not self.input_image_path or not self.view_model.last_result:
             return
         
-        # Ask for mask format
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QRadioButton, QDialogButtonBox
+        # Ask for mask format (dialog is built once and reused)
+        if self._format_dialog is None:
+            self._format_dialog = self._build_format_dialog()
         
+        self._format_radios[self._last_format_type].setChecked(True)
+        
+        if self._format_dialog.exec() == QDialog.DialogCode.Accepted:
+            # Determine format
+            format_type = next(
+                name for name, radio in self._format_radios.items() if radio.isChecked()
+            )
+            self._last_format_type = format_type
+            
+            asyncio.create_task(self._export_mask(format_type))
+    
+    def _build_format_dialog(self) -> QDialog:
+        """Create the mask format selection dialog."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Export Mask Format")
         layout = QVBoxLayout(dialog)
         
         layout.addWidget(QLabel("Select mask format:"))
-        radio_grayscale = QRadioButton("Grayscale (0-255)")
-        radio_binary = QRadioButton("Binary (Black/White)")
-        radio_alpha = QRadioButton("Alpha Channel")
-        radio_grayscale.setChecked(True)
+        self._format_radios = {
+            "grayscale": QRadioButton("Grayscale (0-255)"),
+            "binary": QRadioButton("Binary (Black/White)"),
+            "alpha": QRadioButton("Alpha Channel")
+        }
         
-        layout.addWidget(radio_grayscale)
-        layout.addWidget(radio_binary)
-        layout.addWidget(radio_alpha)
+        for radio in self._format_radios.values():
+            layout.addWidget(radio)
         
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
@@ -767,20 +805,23 @@ class MainWindow(QMainWindow):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Determine format
-            if radio_grayscale.isChecked():
-                format_type = "grayscale"
-            elif radio_binary.isChecked():
-                format_type = "binary"
-            else:
-                format_type = "alpha"
-            
-            asyncio.create_task(self._export_mask(format_type))
+        return dialog
     
     async def _export_mask(self, format_type: str):
         """Export mask asynchronously."""
-        from src.application.use_cases.export_mask_use_case import ExportMaskUseCase
+        # Ask where to save first - cancelling skips inference and encoding entirely
+        default_folder = self.view_model.settings.default_save_folder or str(self.input_image_path.parent)
+        default_name = f"{self.input_image_path.stem}_mask.png"
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Mask",
+            str(Path(default_folder) / default_name),
+            "PNG Image (*.png)"
+        )
+        
+        if not file_path:
+            return
         
         try:
             # Create use case
@@ -790,40 +831,53 @@ class MainWindow(QMainWindow):
                 settings=self.view_model.settings
             )
             
-            # Export based on format
-            if format_type == "grayscale":
-                result = await export_use_case.execute_grayscale(self.input_image_path)
-            elif format_type == "binary":
-                result = await export_use_case.execute_binary(self.input_image_path)
+            # Reuse the previous export if neither the file nor the settings changed
+            settings = self.view_model.settings
+            cache_key = (
+                str(self.input_image_path),
+                self.input_image_path.stat().st_mtime_ns,
+                format_type,
+                settings.threshold,
+                settings.smooth_pixels,
+                settings.feather_pixels
+            )
+            # Entries are the encoded file, so a repeat export is a single write
+            image_io = self.view_model.use_case.image_io
+            cached = self._export_cache.get(cache_key)
+            
+            if cached is not None:
+                self._export_cache.move_to_end(cache_key)
             else:
-                result = await export_use_case.execute_alpha(self.input_image_path)
+                # Export based on format
+                if format_type == "grayscale":
+                    result = await export_use_case.execute_grayscale(self.input_image_path)
+                elif format_type == "binary":
+                    result = await export_use_case.execute_binary(self.input_image_path)
+                else:
+                    result = await export_use_case.execute_alpha(self.input_image_path)
+                
+                if format_type == "binary":
+                    # Binary mask only needs 1 bit per pixel
+                    mask_bool = result.output.data[:, :, 0] >= 128
+                    png = await image_io.encode_png_1bit(mask_bool)
+                else:
+                    png = await image_io.encode_png_rgba(result.output)
+                
+                cached = (png, result.processing_time_ms)
+                self._export_cache[cache_key] = cached
+                if len(self._export_cache) > self.EXPORT_CACHE_SIZE:
+                    self._export_cache.popitem(last=False)
             
-            # Ask where to save
-            default_folder = self.view_model.settings.default_save_folder or str(self.input_image_path.parent)
-            default_name = f"{self.input_image_path.stem}_mask.png"
+            png, processing_time_ms = cached
+            await image_io.save_bytes(png, Path(file_path))
             
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "Save Mask",
-                str(Path(default_folder) / default_name),
-                "PNG Image (*.png)"
+            # Non-blocking notification so the next export can start right away
+            self.last_mask_path = Path(file_path)
+            self.btn_reveal_mask.show()
+            self.status_bar.showMessage(
+                self._EXPORT_MSG.format(f=file_path, t=processing_time_ms),
+                5000
             )
-            
-            if file_path:
-                await self.view_model.use_case.image_io.save_png_rgba(
-                    result.output,
-                    Path(file_path)
-                )
-                self.status_bar.showMessage(f"Mask saved: {file_path} ({result.processing_time_ms:.0f}ms)")
-                
-                QMessageBox.information(
-                    self,
-                    "Mask Exported",
-                    f"Mask exported successfully!\n\n"
-                    f"Format: RGBA\n"
-                    f"Time: {result.processing_time_ms:.0f}ms\n"
-                    f"File: {file_path}"
-                )
         
         except Exception as e:
             QMessageBox.critical(
@@ -832,6 +886,11 @@ class MainWindow(QMainWindow):
                 f"Failed to export mask:\n{str(e)}"
             )
     
+    def _on_reveal_mask(self):
+        """Open the folder containing the last exported mask."""
+        if self.last_mask_path:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(self.last_mask_path.parent)))
+    
     def dragEnterEvent(self, event):
         """Handle drag enter event."""
         if event.mimeData().hasUrls():
@@ -839,17 +898,44 @@ class MainWindow(QMainWindow):
         else:
             event.ignore()
     
+    @staticmethod
+    def _is_supported_image(path: Path) -> bool:
+        """Check for a supported suffix and a matching PNG, JPEG, WebP or BMP signature."""
+        # The loader gates on suffix, so a misnamed file would only fail later
+        if path.suffix.lower() not in LocalImageIO.SUPPORTED_FORMATS:
+            return False
+        
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(16)
+        except OSError:
+            return False
+        
+        return (
+            head.startswith(b'\x89PNG\r\n\x1a\n')
+            or head.startswith(b'\xff\xd8\xff')
+            or (head[:4] == b'RIFF' and head[8:12] == b'WEBP')
+            or head.startswith(b'BM')
+        )
+    
     def dropEvent(self, event):
         """Handle drop event."""
         files = [url.toLocalFile() for url in event.mimeData().urls()]
         if files:
             file_path = Path(files[0])
-            # Check if it's an image
-            if file_path.suffix.lower() in {'.jpg', '.jpeg', '.png', '.webp', '.bmp'}:
+            # Check if it's an image (by suffix and content)
+            if self._is_supported_image(file_path):
                 self.input_image_path = file_path
                 
-                # Display image
-                pixmap = QPixmap(str(file_path))
+                # Display image, decoding straight at preview size
+                reader = QImageReader(str(file_path))
+                orig_size = reader.size()
+                target_size = orig_size.scaled(
+                    self.preview_input.size(), Qt.AspectRatioMode.KeepAspectRatio
+                )
+                if target_size.width() < orig_size.width():
+                    reader.setScaledSize(target_size)
+                pixmap = QPixmap.fromImage(reader.read())
                 self.preview_input.set_image(pixmap, use_checkerboard=False)
                 self.preview_input.fit_to_view()
                 
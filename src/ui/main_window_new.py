@@ -1,33 +1,204 @@
 """Modern redesigned main window."""
 import asyncio
+import gc
+import os
+import sys
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, TYPE_CHECKING
+import cv2
+import numpy as np
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QFileDialog, QMessageBox, QGroupBox, QSlider, QCheckBox,
-    QStatusBar, QFrame, QSizePolicy, QComboBox
+    QStatusBar, QFrame, QSizePolicy, QComboBox, QProgressDialog,
+    QColorDialog, QDialog, QRadioButton, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QPixmap, QDragEnterEvent, QDropEvent
+from PyQt6.QtCore import Qt, QTimer, QSize, QEvent, QThreadPool, QSignalBlocker
+from PyQt6 import sip
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QColor, QPalette, QDragEnterEvent, QDropEvent
+from PIL import Image
+from PIL.ImageQt import ImageQt
+
+from src.domain.entities.image_input import ImageInput
+from src.domain.entities.mask import Mask
+from src.domain.entities.image_output import ImageOutput
+from src.domain.entities.settings import Settings
+from src.domain.services.post_process_mask import PostProcessMask
+from src.domain.services.alpha_compose import AlphaCompose
+from src.application.use_cases.export_mask_use_case import ExportMaskUseCase
 
 from .view_models.main_view_model import MainViewModel
 from .widgets.image_preview import ImagePreviewWidget
+from .widgets.clickable_label import ClickableLabel
 from .translations import Translator
 
+if TYPE_CHECKING:
+    from .workers.batch_worker import BatchWorker
+
+# Extensions accepted by batch folder scans (matches LocalImageIO.SUPPORTED_FORMATS)
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.bmp'})
+
+# Batch worker class, imported on the first batch run rather than at launch
+_BATCH_WORKER = None
+
+
+def _get_batch_worker():
+    """Return the BatchWorker class, importing it once."""
+    global _BATCH_WORKER
+    if _BATCH_WORKER is None:
+        from .workers.batch_worker import BatchWorker
+        _BATCH_WORKER = BatchWorker
+    return _BATCH_WORKER
+
 
 class MainWindowNew(QMainWindow):
     """Modern redesigned main window with better UX."""
     
+    PROXY_SIZE = 512  # Long edge of the mask used while dragging sliders
+    THUMB_SIZE = 800  # Long edge of the quick first preview on load
+    PREVIEW_SIZE = 1200  # Long edge of the reduced result composited while zoomed out
+    CHECKER_SIZE = 16  # Checkerboard square size in pixels
+    PREVIEW_CACHE_ENTRIES = 6  # Rendered result previews kept in QPixmapCache
+    GC_GROWTH_FACTOR = 1.5  # Collect on reset once allocated blocks grew this much
+    BATCH_CACHE_FOLDER = Path.home() / ".cache" / "tinhsoftware" / "batch"
+    
+    # Widget styles, parsed once and scoped by objectName or role property. They stay
+    # on the widgets (or their nearest container) because the nearer container
+    # stylesheets would override window rules.
+    # The process button switches look through the is_reset_mode property.
+    _ZOOM_CONTROLS_QSS = """
+        QWidget#zoomControls {
+            background: transparent;
+            border: none;
+        }
+        QPushButton[role="icon"] {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 rgba(255, 255, 255, 0.95), 
+                stop:1 rgba(245, 245, 245, 0.95));
+            border: none;
+            border-bottom: 2px solid rgba(0, 0, 0, 0.2);
+            border-radius: 20px;
+            padding: 0px;
+            font-size: 18px;
+            font-weight: bold;
+            color: #3498db;
+            min-width: 40px;
+            min-height: 40px;
+            max-width: 40px;
+            max-height: 40px;
+        }
+        QPushButton[role="icon"]:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #3498db, 
+                stop:1 #2980b9);
+            border: none;
+            color: white;
+        }
+        QPushButton[role="icon"]:pressed {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #2980b9, 
+                stop:1 #21618c);
+            border: none;
+            color: white;
+        }
+    """
+    
+    _DROP_AREA_QSS = """
+        QLabel#dropArea {
+            border: 3px dashed #3498db;
+            border-radius: 10px;
+            background: rgba(236, 240, 241, 0.95);
+            font-size: 18px;
+            font-weight: bold;
+            color: #3498db;
+            padding: 40px;
+        }
+        QLabel#dropArea:hover, QLabel#dropArea[drag_active="true"] {
+            background: rgba(213, 219, 219, 0.95);
+            border-color: #2980b9;
+            color: #2980b9;
+        }
+    """
+    
+    _PROCESS_BUTTON_STYLE = """
+        QPushButton#processButton {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #3498db, stop:1 #2ecc71);
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            border: none;
+            border-radius: 8px;
+            padding: 12px 20px;
+        }
+        QPushButton#processButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #2980b9, stop:1 #27ae60);
+        }
+        QPushButton#processButton:pressed {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #21618c, stop:1 #1e8449);
+        }
+        QPushButton#processButton:disabled {
+            background: #bdc3c7;
+            color: #95a5a6;
+        }
+        QPushButton#processButton[is_reset_mode="true"] {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #e74c3c, stop:1 #c0392b);
+        }
+        QPushButton#processButton[is_reset_mode="true"]:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #c0392b, stop:1 #a93226);
+        }
+    """
+    
     def __init__(self, view_model: MainViewModel):
         super().__init__()
         self.view_model = view_model
         self.translator = Translator('vi')  # Default to Vietnamese
         self.input_image_path: Optional[Path] = None
+        self._input_load_id = 0  # Bumped when a pending input decode must not show up
         self.output_image_path: Optional[Path] = None
         self.bg_color = None
         self.transparent_result = None
         self.raw_mask = None
         self.original_image = None
+        self._preview_generation = 0  # Bumped whenever transparent_result changes
+        self._input_on_screen = False  # Preview shows the input, not a result
+        self._preview_cache_keys = []  # QPixmapCache keys of rendered result previews
+        self._opaque_out = None  # Reused (H, W, 4) buffer for color preview, alpha = 255
+        self._blend_weights = None  # Reused (2, H, W) float32 blend weights for _opaque_out
+        self._blend_weights_key = None  # (generation, shape) the weights were computed for
+        self._preview_lod = None  # (generation, reduced transparent_result, scale)
+        self._background_cache = None  # (H, W, 4) checkerboard or color fill to blend under
+        self._background_key = None  # (shape, color) of _background_cache
+        
+        # Downscaled copies used while a slider is being dragged
+        self._raw_mask_proxy = None
+        self._original_image_proxy = None
+        self._proxy_compose_buf = None  # Proxy RGBA reused during drags; RGB filled once
+        self._proxy_compose_src = None  # Image proxy whose RGB is in _proxy_compose_buf
+        self._interactive = False
+        self._preview_dirty = False  # Preview update skipped while hidden/minimized
+        self._last_settings_key = None  # Settings the current transparent_result was built with
+        self._gc_block_baseline = sys.getallocatedblocks()
+        self._batch_worker: Optional["BatchWorker"] = None
+        self._batch_in_flight = False  # Guards against starting a second batch
+        self._mask_fmt_dialog: Optional[QDialog] = None  # Built on first mask export
+        
+        QPixmapCache.setCacheLimit(131072)  # KB, room for a full-size input plus previews
+        
+        # Slider values not yet written to the settings; applied together on reprocess
+        self._pending_settings = {}
+        
+        # Coalesce slider ticks into one reprocess per idle window; drags render the
+        # small proxy, so a short window keeps feedback snappy without piling up work
+        self._reprocess_timer = QTimer(self)
+        self._reprocess_timer.setSingleShot(True)
+        self._reprocess_timer.setInterval(50)
+        self._reprocess_timer.timeout.connect(self._reprocess_with_settings)
         
         self.setWindowTitle("RemoveBG - AI Background Removal")
         self.setGeometry(100, 100, 1600, 900)
@@ -35,7 +206,9 @@ class MainWindowNew(QMainWindow):
         
         self._setup_modern_ui()
         self._connect_signals()
-        self._apply_modern_styles()
+        
+        # Style the finished widget tree in one pass once the event loop starts
+        QTimer.singleShot(0, self._apply_modern_styles)
     
     def _setup_modern_ui(self):
         """Setup modern UI layout."""
@@ -120,12 +293,13 @@ class MainWindowNew(QMainWindow):
     
     def _create_left_panel(self) -> QWidget:
         """Create left panel with single preview and process button."""
+        t = self.translator.t
         panel = QWidget()
         layout = QVBoxLayout(panel)
         layout.setSpacing(15)
         
         # Single preview area (shows input or output)
-        self.input_group = QGroupBox(self.translator.t('input_image'))
+        self.input_group = QGroupBox(t('input_image'))
         input_layout = QVBoxLayout()
         
         # Image preview
@@ -134,25 +308,11 @@ class MainWindowNew(QMainWindow):
         input_layout.addWidget(self.preview_input)
         
         # Drag & Drop overlay label
-        self.drop_area = QLabel(self.translator.t('drag_drop_text'))
+        self.drop_area = ClickableLabel(t('drag_drop_text'))
         self.drop_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.drop_area.setStyleSheet("""
-            QLabel {
-                border: 3px dashed #3498db;
-                border-radius: 10px;
-                background: rgba(236, 240, 241, 0.95);
-                font-size: 18px;
-                font-weight: bold;
-                color: #3498db;
-                padding: 40px;
-            }
-            QLabel:hover {
-                background: rgba(213, 219, 219, 0.95);
-                border-color: #2980b9;
-                color: #2980b9;
-            }
-        """)
-        self.drop_area.mousePressEvent = lambda e: self._on_open_image()
+        self.drop_area.setObjectName("dropArea")
+        self.drop_area.setStyleSheet(self._DROP_AREA_QSS)
+        self.drop_area.clicked.connect(self._on_open_image)
         self.drop_area.setParent(self.preview_input)
         self.drop_area.setGeometry(30, 100, 540, 200)
         
@@ -166,62 +326,21 @@ class MainWindowNew(QMainWindow):
         self.btn_zoom_in_input = QPushButton("+")
         self.btn_zoom_out_input = QPushButton("−")
         
-        # Modern circular button style with shadow and gradient
-        icon_button_style = """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(255, 255, 255, 0.95), 
-                    stop:1 rgba(245, 245, 245, 0.95));
-                border: none;
-                border-radius: 20px;
-                padding: 0px;
-                font-size: 18px;
-                font-weight: bold;
-                color: #3498db;
-                min-width: 40px;
-                min-height: 40px;
-                max-width: 40px;
-                max-height: 40px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3498db, 
-                    stop:1 #2980b9);
-                border: none;
-                color: white;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2980b9, 
-                    stop:1 #21618c);
-                border: none;
-                color: white;
-            }
-        """
-        self.btn_fit_input.setStyleSheet(icon_button_style)
-        self.btn_zoom_in_input.setStyleSheet(icon_button_style)
-        self.btn_zoom_out_input.setStyleSheet(icon_button_style)
-        
-        self.btn_fit_input.setToolTip(self.translator.t('fit'))
-        self.btn_zoom_in_input.setToolTip(self.translator.t('zoom_in'))
-        self.btn_zoom_out_input.setToolTip(self.translator.t('zoom_out'))
-        
-        # Add shadow effect
-        from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-        from PyQt6.QtGui import QColor
-        for btn in [self.btn_fit_input, self.btn_zoom_in_input, self.btn_zoom_out_input]:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(8)
-            shadow.setColor(QColor(0, 0, 0, 80))
-            shadow.setOffset(0, 2)
-            btn.setGraphicsEffect(shadow)
+        # Modern circular buttons; one sheet on the container styles all three
+        for btn in (self.btn_fit_input, self.btn_zoom_in_input, self.btn_zoom_out_input):
+            btn.setProperty('role', 'icon')
+        
+        self.btn_fit_input.setToolTip(t('fit'))
+        self.btn_zoom_in_input.setToolTip(t('zoom_in'))
+        self.btn_zoom_out_input.setToolTip(t('zoom_out'))
         
         zoom_controls_layout.addWidget(self.btn_fit_input)
         zoom_controls_layout.addWidget(self.btn_zoom_in_input)
         zoom_controls_layout.addWidget(self.btn_zoom_out_input)
         
         zoom_controls_widget.setGeometry(10, 10, 40, 136)
-        zoom_controls_widget.setStyleSheet("background: transparent; border: none;")
+        zoom_controls_widget.setObjectName("zoomControls")
+        zoom_controls_widget.setStyleSheet(self._ZOOM_CONTROLS_QSS)
         
         self.input_group.setLayout(input_layout)
         layout.addWidget(self.input_group, stretch=1)
@@ -240,7 +359,7 @@ class MainWindowNew(QMainWindow):
         actions_layout.setSpacing(12)
         
         # Change Image Button (modern design with icon)
-        self.btn_change_image = QPushButton(self.translator.t('change_image').upper())
+        self.btn_change_image = QPushButton(t('change_image').upper())
         self.btn_change_image.setMinimumHeight(55)
         self.btn_change_image.clicked.connect(self._on_open_image)
         self.btn_change_image.setStyleSheet("""
@@ -265,34 +384,12 @@ class MainWindowNew(QMainWindow):
         actions_layout.addWidget(self.btn_change_image, stretch=1)
         
         # Process Button (Remove Background / Reset)
-        self.btn_process = QPushButton(self.translator.t('remove_background').upper())
+        self.btn_process = QPushButton(t('remove_background').upper())
         self.btn_process.setMinimumHeight(55)
         self.btn_process.setEnabled(False)
+        self.btn_process.setObjectName("processButton")
         self.btn_process.setProperty('is_reset_mode', False)
-        self.btn_process.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3498db, stop:1 #2ecc71);
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2980b9, stop:1 #27ae60);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #21618c, stop:1 #1e8449);
-            }
-            QPushButton:disabled {
-                background: #bdc3c7;
-                color: #95a5a6;
-            }
-        """)
+        self.btn_process.setStyleSheet(self._PROCESS_BUTTON_STYLE)
         actions_layout.addWidget(self.btn_process, stretch=2)
         
         layout.addWidget(actions_container)
@@ -301,26 +398,53 @@ class MainWindowNew(QMainWindow):
     
     def _create_right_panel(self) -> QWidget:
         """Create right panel with all controls."""
+        t = self.translator.t
         panel = QWidget()
         layout = QVBoxLayout(panel)
         layout.setSpacing(15)
         
         # Processing Info
-        self.info_group = QGroupBox(self.translator.t('processing_info'))
+        self.info_group = QGroupBox(t('processing_info'))
         info_layout = QVBoxLayout()
-        self.lbl_info = QLabel(self.translator.t('no_image_processed'))
+        self.lbl_info = QLabel(t('no_image_processed'))
         self.lbl_info.setWordWrap(True)
         info_layout.addWidget(self.lbl_info)
         self.info_group.setLayout(info_layout)
         layout.addWidget(self.info_group)
         
+        # Options
+        self.options_group = QGroupBox(t('options'))
+        options_layout = QVBoxLayout()
+        
+        self.chk_auto_crop = QCheckBox(t('auto_crop'))
+        self.chk_auto_crop.setChecked(self.view_model.settings.auto_crop_output)
+        options_layout.addWidget(self.chk_auto_crop)
+        
+        self.options_group.setLayout(options_layout)
+        layout.addWidget(self.options_group)
+        
+        # Fine-tune, background and save controls are only useful once an image is
+        # loaded; _ensure_controls_built() adds them on first use
+        self._right_layout = layout
+        self._controls_built = False
+        
+        return panel
+    
+    def _ensure_controls_built(self):
+        """Build the deferred right-panel groups and connect their signals once."""
+        if self._controls_built:
+            return
+        self._controls_built = True
+        t = self.translator.t
+        layout = self._right_layout
+        
         # Adjustments
-        self.adjust_group = QGroupBox(self.translator.t('fine_tune'))
+        self.adjust_group = QGroupBox(t('fine_tune'))
         adjust_layout = QVBoxLayout()
         
         # Threshold
         threshold_layout = QHBoxLayout()
-        self.lbl_threshold_title = QLabel(self.translator.t('threshold'))
+        self.lbl_threshold_title = QLabel(t('threshold'))
         threshold_layout.addWidget(self.lbl_threshold_title)
         self.slider_threshold = QSlider(Qt.Orientation.Horizontal)
         self.slider_threshold.setMinimum(0)
@@ -333,7 +457,7 @@ class MainWindowNew(QMainWindow):
         
         # Smooth
         smooth_layout = QHBoxLayout()
-        self.lbl_smooth_title = QLabel(self.translator.t('smooth'))
+        self.lbl_smooth_title = QLabel(t('smooth'))
         smooth_layout.addWidget(self.lbl_smooth_title)
         self.slider_smooth = QSlider(Qt.Orientation.Horizontal)
         self.slider_smooth.setMinimum(0)
@@ -346,7 +470,7 @@ class MainWindowNew(QMainWindow):
         
         # Feather
         feather_layout = QHBoxLayout()
-        self.lbl_feather_title = QLabel(self.translator.t('feather'))
+        self.lbl_feather_title = QLabel(t('feather'))
         feather_layout.addWidget(self.lbl_feather_title)
         self.slider_feather = QSlider(Qt.Orientation.Horizontal)
         self.slider_feather.setMinimum(0)
@@ -358,15 +482,15 @@ class MainWindowNew(QMainWindow):
         adjust_layout.addLayout(feather_layout)
         
         self.adjust_group.setLayout(adjust_layout)
-        layout.addWidget(self.adjust_group)
+        layout.insertWidget(1, self.adjust_group)
         
         # Background Color Preview
-        self.bg_group = QGroupBox(self.translator.t('bg_color_preview'))
+        self.bg_group = QGroupBox(t('bg_color_preview'))
         bg_layout = QVBoxLayout()
         bg_layout.setSpacing(10)
         
         # Checkerboard checkbox
-        self.chk_checkerboard = QCheckBox(self.translator.t('checkerboard'))
+        self.chk_checkerboard = QCheckBox(t('checkerboard'))
         self.chk_checkerboard.setChecked(True)
         bg_layout.addWidget(self.chk_checkerboard)
         
@@ -376,49 +500,38 @@ class MainWindowNew(QMainWindow):
         color_layout.setContentsMargins(0, 5, 0, 5)
         color_layout.setSpacing(10)
         
-        self.btn_pick_color = QPushButton(self.translator.t('pick_color'))
+        self.btn_pick_color = QPushButton(t('pick_color'))
         self.btn_pick_color.setEnabled(False)
         self.btn_pick_color.setMinimumHeight(40)
-        self.btn_pick_color.setToolTip(self.translator.t('pick_color_tooltip') if hasattr(self.translator, 't') else "Click to pick color, double-click to clear")
+        self.btn_pick_color.setToolTip(t('pick_color_tooltip'))
         color_layout.addWidget(self.btn_pick_color, stretch=2)
         
         # Color preview box (larger) - double-click to clear
-        self.lbl_color_preview = QLabel("")
+        self.lbl_color_preview = ClickableLabel("")
         self.lbl_color_preview.setFixedSize(80, 40)
-        self.lbl_color_preview.setStyleSheet(
-            "background-color: transparent; "
-            "border: 2px solid #bdc3c7; "
-            "border-radius: 8px;"
-        )
+        # Border is set once here; the fill color goes through the palette so picking
+        # a color doesn't re-parse a stylesheet
+        self.lbl_color_preview.setStyleSheet("border: 2px solid #bdc3c7; border-radius: 8px;")
+        self.lbl_color_preview.setAutoFillBackground(True)
+        self._set_color_preview(None)
         self.lbl_color_preview.setToolTip("Double-click to clear color")
-        self.lbl_color_preview.mouseDoubleClickEvent = lambda e: self._on_clear_color()
+        self.lbl_color_preview.double_clicked.connect(self._on_clear_color)
         color_layout.addWidget(self.lbl_color_preview)
         
         bg_layout.addWidget(color_container)
         
         self.bg_group.setLayout(bg_layout)
-        layout.addWidget(self.bg_group)
-        
-        # Options
-        self.options_group = QGroupBox(self.translator.t('options'))
-        options_layout = QVBoxLayout()
-        
-        self.chk_auto_crop = QCheckBox(self.translator.t('auto_crop'))
-        self.chk_auto_crop.setChecked(self.view_model.settings.auto_crop_output)
-        options_layout.addWidget(self.chk_auto_crop)
-        
-        self.options_group.setLayout(options_layout)
-        layout.addWidget(self.options_group)
+        layout.insertWidget(2, self.bg_group)
         
         # Save & Export Button (moved to bottom)
-        self.actions_group = QGroupBox(self.translator.t('save_export'))
+        self.actions_group = QGroupBox(t('save_export'))
         actions_layout = QVBoxLayout()
         
         # Save PNG button only
-        self.btn_save = QPushButton(self.translator.t('save_png').upper())
+        self.btn_save = QPushButton(t('save_png').upper())
         self.btn_save.setMinimumHeight(55)
         self.btn_save.setEnabled(False)
-        self.btn_save.setToolTip(self.translator.t('save_png_tooltip'))
+        self.btn_save.setToolTip(t('save_png_tooltip'))
         self.btn_save.setStyleSheet("""
             QPushButton {
                 background: #27ae60;
@@ -434,7 +547,20 @@ class MainWindowNew(QMainWindow):
         self.actions_group.setLayout(actions_layout)
         layout.addWidget(self.actions_group)
         
-        return panel
+        # Action buttons
+        self.btn_save.clicked.connect(self._on_save_image)
+        
+        # Sliders
+        self.slider_threshold.valueChanged.connect(self._on_threshold_changed)
+        self.slider_smooth.valueChanged.connect(self._on_smooth_changed)
+        self.slider_feather.valueChanged.connect(self._on_feather_changed)
+        for slider in (self.slider_threshold, self.slider_smooth, self.slider_feather):
+            slider.sliderPressed.connect(self._on_slider_pressed)
+            slider.sliderReleased.connect(self._flush_reprocess)
+        
+        # Background color
+        self.btn_pick_color.clicked.connect(self._on_pick_color)
+        self.chk_checkerboard.stateChanged.connect(self._on_checkerboard_changed)
     
     def _apply_modern_styles(self):
         """Apply modern stylesheet."""
@@ -493,6 +619,12 @@ class MainWindowNew(QMainWindow):
             }
         """)
     
+    @staticmethod
+    def _repolish(widget: QWidget):
+        """Re-evaluate stylesheet selectors after a dynamic property change."""
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+    
     def _update_zoom_label(self):
         """Update zoom percentage label (removed - no longer used)."""
         pass
@@ -503,22 +635,13 @@ class MainWindowNew(QMainWindow):
         self.btn_fit_input.clicked.connect(self._on_fit_view)
         self.btn_zoom_in_input.clicked.connect(self._on_zoom_in)
         self.btn_zoom_out_input.clicked.connect(self._on_zoom_out)
+        self.preview_input.zoom_changed.connect(self._on_preview_zoom_changed)
         
         # Action buttons - Process button toggles between remove/reset
         self.btn_process.clicked.connect(self._on_process_clicked)
-        self.btn_save.clicked.connect(self._on_save_image)
-        
-        # Sliders
-        self.slider_threshold.valueChanged.connect(self._on_threshold_changed)
-        self.slider_smooth.valueChanged.connect(self._on_smooth_changed)
-        self.slider_feather.valueChanged.connect(self._on_feather_changed)
         
-        # Background color
-        self.btn_pick_color.clicked.connect(self._on_pick_color)
-        
-        # Options
+        # Options (the remaining controls connect in _ensure_controls_built)
         self.chk_auto_crop.stateChanged.connect(self._on_auto_crop_changed)
-        self.chk_checkerboard.stateChanged.connect(self._on_checkerboard_changed)
     
     def _on_fit_view(self):
         """Handle fit to view button."""
@@ -557,36 +680,140 @@ class MainWindowNew(QMainWindow):
         )
         
         if file_path:
-            self.input_image_path = Path(file_path)
-            pixmap = QPixmap(str(file_path))
-            self.preview_input.set_image(pixmap, use_checkerboard=False)
-            self.preview_input.fit_to_view()
-            
-            # Hide drop area overlay
-            self.drop_area.hide()
-            
-            self.btn_process.setEnabled(True)
-            self.status_bar.showMessage(f"{self.translator.t('loaded')}: {file_path}")
+            asyncio.create_task(self._load_path(Path(file_path)))
+    
+    async def _load_path(self, path: Path):
+        """Show image from path in the preview and enable processing."""
+        self.input_image_path = path
+        self._ensure_controls_built()
+        self._input_load_id += 1
+        load_id = self._input_load_id
+        
+        # Hide drop area overlay
+        self.drop_area.hide()
+        
+        # The previous result belongs to the old image; drop it before the new one shows
+        self._clear_result()
+        
+        try:
+            if not self._show_cached_input(path) and not await self._decode_input(path, load_id):
+                return  # Another image was opened meanwhile
+        except Exception as e:
+            t = self.translator.t
+            QMessageBox.critical(self, t('error'), str(e))
+            return
+        
+        self.btn_process.setEnabled(True)
+        self.status_bar.showMessage(f"{self.translator.t('loaded')}: {path}")
+    
+    @staticmethod
+    def _input_cache_key(path: Path) -> str:
+        """QPixmapCache key of the decoded input; changes when the file does."""
+        return f"input_{path.resolve()}_{path.stat().st_mtime_ns}"
+    
+    def _show_cached_input(self, path: Path) -> bool:
+        """
+        Show the decoded pixmap of path if QPixmapCache still has it.
+        
+        Re-opening an unchanged file, or Reset, reuses it instead of decoding again.
+        
+        Returns:
+            True if shown, False if it has to be decoded
+        """
+        cached = QPixmapCache.find(self._input_cache_key(path))
+        if cached is None:
+            return False
+        self._show_input(cached)
+        return True
+    
+    def _show_input(self, pixmap: QPixmap):
+        """Show an input pixmap fitted to the view; zoom changes leave it alone."""
+        self._input_on_screen = True
+        self.preview_input.set_image(pixmap, use_checkerboard=False)
+        self.preview_input.fit_to_view()
+    
+    async def _decode_input(self, path: Path, load_id: int) -> bool:
+        """
+        Decode path on a worker thread (small thumbnail first, then full resolution),
+        show it and cache the full pixmap.
+        
+        Returns:
+            False if a newer load, reset or processing run superseded this one
+        """
+        cache_key = self._input_cache_key(path)
+        thumb = await asyncio.to_thread(self._decode_image, path, self.THUMB_SIZE)
+        if load_id != self._input_load_id:
+            return False
+        self._show_input(QPixmap.fromImage(thumb))
+        
+        full = await asyncio.to_thread(self._decode_image, path)
+        if load_id != self._input_load_id:
+            return False
+        pixmap = QPixmap.fromImage(full)
+        QPixmapCache.insert(cache_key, pixmap)
+        self._show_input(pixmap)
+        return True
+    
+    async def _restore_input(self, path: Path, load_id: int):
+        """Decode the input again for Reset when its pixmap was evicted from the cache."""
+        try:
+            await self._decode_input(path, load_id)
+        except Exception as e:
+            QMessageBox.critical(self, self.translator.t('error'), str(e))
+    
+    @staticmethod
+    def _decode_image(path: Path, max_size: Optional[int] = None) -> QImage:
+        """
+        Decode image as an RGBA QImage, optionally reduced to fit max_size.
+        
+        Runs off the GUI thread; QImage (unlike QPixmap) may be built on any thread,
+        so the byte conversion happens here and the GUI thread only uploads it.
+        """
+        with Image.open(path) as pil_image:
+            if max_size:
+                # JPEG can decode at 1/2..1/8 scale directly
+                pil_image.draft('RGB', (max_size, max_size))
+                pil_image = pil_image.convert('RGBA')
+                pil_image.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
+            else:
+                pil_image = pil_image.convert('RGBA')
+        # ImageQt keeps a reference to its pixel bytes for the QImage's lifetime
+        return ImageQt(pil_image)
+    
+    def showEvent(self, event):
+        """Render a preview update that was skipped while hidden."""
+        super().showEvent(event)
+        if self._preview_dirty:
+            self._update_preview_with_background()
+    
+    def changeEvent(self, event):
+        """Render a skipped preview update when restored from minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self._preview_dirty:
+            self._update_preview_with_background()
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter."""
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
+            self._set_drag_active(True)
+    
+    def dragLeaveEvent(self, event):
+        """Handle drag leave."""
+        self._set_drag_active(False)
+    
+    def _set_drag_active(self, active: bool):
+        """Highlight drop area via dynamic property (no stylesheet rewrite)."""
+        if self.drop_area.isVisible():
+            self.drop_area.setProperty('drag_active', active)
+            self._repolish(self.drop_area)
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop."""
+        self._set_drag_active(False)
         files = [u.toLocalFile() for u in event.mimeData().urls()]
         if files:
-            self.input_image_path = Path(files[0])
-            pixmap = QPixmap(str(files[0]))
-            self.preview_input.set_image(pixmap, use_checkerboard=False)
-            self.preview_input.fit_to_view()
-            
-            # Hide drop area overlay
-            self.drop_area.hide()
-            
-            self.btn_process.setEnabled(True)
-            self.status_bar.showMessage(f"{self.translator.t('loaded')}: {files[0]}")
+            asyncio.create_task(self._load_path(Path(files[0])))
     
     def _on_remove_background(self):
         """Handle remove background button."""
@@ -596,17 +823,37 @@ class MainWindowNew(QMainWindow):
         self.btn_process.setEnabled(False)
         self.btn_process.setText(self.translator.t('processing').upper())
         self.status_bar.showMessage(self.translator.t('processing'))
+        self._input_load_id += 1  # The result replaces any input still decoding
         
-        QTimer.singleShot(100, lambda: asyncio.create_task(self._process_image()))
+        # qasync loop is already running (run_mock.py), no need to defer via a timer
+        asyncio.ensure_future(self._process_image())
     
     async def _process_image(self):
         """Process image asynchronously."""
+        self._apply_pending_settings()
         try:
-            result = await self.view_model.remove_background(self.input_image_path)
+            # The pipeline is synchronous inside, so run it on a worker thread
+            result = await asyncio.to_thread(
+                asyncio.run, self.view_model.remove_background(self.input_image_path)
+            )
+            
+            # Proxies and the reduced preview are plain array work, keep it off the GUI thread
+            mask_proxy, image_proxy, reduced = await asyncio.to_thread(
+                self._prepare_result_buffers, result
+            )
             
-            self.transparent_result = result.output.data.copy()
+            # Preview only reads this array, so share it instead of copying; read-only
+            # so an accidental in-place write fails instead of corrupting the saved result
+            self.transparent_result = result.output.data
+            self.transparent_result.flags.writeable = False
+            self._preview_generation += 1
             self.raw_mask = result.raw_mask
             self.original_image = result.original_image
+            self._raw_mask_proxy = mask_proxy
+            self._original_image_proxy = image_proxy
+            if reduced is not None:
+                self._preview_lod = (self._preview_generation,) + reduced
+            self._last_settings_key = self._settings_key()
             
             self.output_image_path = self.input_image_path.parent / f"{self.input_image_path.stem}_nobg.png"
             
@@ -617,22 +864,7 @@ class MainWindowNew(QMainWindow):
             # Change button to Reset mode
             self.btn_process.setText(self.translator.t('reset').upper())
             self.btn_process.setProperty('is_reset_mode', True)
-            self.btn_process.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #e74c3c, stop:1 #c0392b);
-                    color: white;
-                    font-size: 20px;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 10px;
-                    padding: 15px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #c0392b, stop:1 #a93226);
-                }
-            """)
+            self._repolish(self.btn_process)
             
             # Enable save button and color picker
             self.btn_save.setEnabled(True)
@@ -661,18 +893,31 @@ class MainWindowNew(QMainWindow):
     def _on_threshold_changed(self, value: int):
         threshold = value / 100.0
         self.label_threshold.setText(f"{threshold:.2f}")
-        self.view_model.settings.threshold = threshold
-        self._reprocess_with_settings()
+        self._pending_settings['threshold'] = threshold
+        self._reprocess_timer.start()
     
     def _on_smooth_changed(self, value: int):
         self.label_smooth.setText(f"{value} px")
-        self.view_model.settings.smooth_pixels = value
-        self._reprocess_with_settings()
+        self._pending_settings['smooth_pixels'] = value
+        self._reprocess_timer.start()
     
     def _on_feather_changed(self, value: int):
         self.label_feather.setText(f"{value} px")
-        self.view_model.settings.feather_pixels = value
-        self._reprocess_with_settings()
+        self._pending_settings['feather_pixels'] = value
+        self._reprocess_timer.start()
+    
+    def _on_slider_pressed(self):
+        """Preview on the downscaled proxy while the slider is held."""
+        self._interactive = True
+    
+    def _flush_reprocess(self):
+        """Run the full-resolution reprocess right away (on slider release)."""
+        was_interactive = self._interactive
+        self._interactive = False
+        
+        if self._reprocess_timer.isActive() or was_interactive:
+            self._reprocess_timer.stop()
+            self._reprocess_with_settings()
     
     def _on_auto_crop_changed(self, state: int):
         self.view_model.settings.auto_crop_output = (state == Qt.CheckState.Checked.value)
@@ -682,95 +927,311 @@ class MainWindowNew(QMainWindow):
             # Set màu trắng mặc định
             if self.bg_color is None:
                 self.bg_color = (255, 255, 255)
-                self.lbl_color_preview.setStyleSheet(
-                    "background-color: rgb(255, 255, 255); "
-                    "border: 2px solid #bdc3c7; border-radius: 5px;"
-                )
+                self._set_color_preview(self.bg_color)
         
         if hasattr(self, 'transparent_result') and self.transparent_result is not None:
             self._update_preview_with_background()
     
+    def _set_color_preview(self, color: Optional[tuple]):
+        """Fill the color swatch with an (r, g, b) color, or leave it transparent."""
+        palette = self.lbl_color_preview.palette()
+        fill = QColor(*color) if color is not None else QColor(Qt.GlobalColor.transparent)
+        palette.setColor(QPalette.ColorRole.Window, fill)
+        self.lbl_color_preview.setPalette(palette)
+    
     def _on_pick_color(self):
-        from PyQt6.QtWidgets import QColorDialog
-        from PyQt6.QtGui import QColor
-        
         initial_color = QColor(*self.bg_color) if self.bg_color else QColor(255, 255, 255)
         color = QColorDialog.getColor(initial_color, self, "Select Background Preview Color")
         
         if color.isValid():
             self.bg_color = (color.red(), color.green(), color.blue())
-            self.lbl_color_preview.setStyleSheet(
-                f"background-color: rgb({color.red()}, {color.green()}, {color.blue()}); "
-                f"border: 2px solid #bdc3c7; "
-                f"border-radius: 8px;"
-            )
+            self._set_color_preview(self.bg_color)
             
-            # Tự động uncheck checkerboard khi pick color
-            self.chk_checkerboard.setChecked(False)
+            # Tự động uncheck checkerboard khi pick color; signals blocked so the
+            # preview is composited once below rather than again from stateChanged
+            with QSignalBlocker(self.chk_checkerboard):
+                self.chk_checkerboard.setChecked(False)
             
             if hasattr(self, 'transparent_result'):
                 self._update_preview_with_background()
     
     def _on_clear_color(self):
         self.bg_color = None
-        self.lbl_color_preview.setStyleSheet(
-            "background-color: transparent; "
-            "border: 2px solid #bdc3c7; "
-            "border-radius: 8px;"
-        )
+        self._set_color_preview(None)
         
         # Tự động check checkerboard khi clear color
-        self.chk_checkerboard.setChecked(True)
+        with QSignalBlocker(self.chk_checkerboard):
+            self.chk_checkerboard.setChecked(True)
         
         if hasattr(self, 'transparent_result'):
             self._update_preview_with_background()
     
     def _update_preview_with_background(self):
-        import numpy as np
-        
         if not hasattr(self, 'transparent_result') or self.transparent_result is None:
             return
         
-        rgba = self.transparent_result.copy()
+        # Nothing on screen to update - render once the window is shown again
+        if self.isMinimized() or not self.preview_input.isVisible():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
         
         # Check checkerboard state first
         use_checkerboard = self.chk_checkerboard.isChecked()
         
+        # Composite on the reduced copy unless zoomed in past its detail
+        scale = self._preview_lod_scale()
+        
+        # Same result + same background already rendered -> reuse the pixmap
+        cache_key = (
+            f"preview_{self._preview_generation}_{self.bg_color}_{int(use_checkerboard)}_{scale:.4f}"
+        )
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None:
+            self._input_on_screen = False
+            self.preview_input.update_image_keep_view(cached, use_checkerboard=False, scale=scale)
+            return
+        
+        self._render_preview(self._preview_source(scale), use_checkerboard, scale)
+        
+        QPixmapCache.insert(cache_key, self.preview_input.original_pixmap)
+        self._preview_cache_keys.append(cache_key)
+        
+        # Every reprocess is a new generation; drop the oldest previews so the key
+        # list and the pixmaps it pins stay bounded
+        while len(self._preview_cache_keys) > self.PREVIEW_CACHE_ENTRIES:
+            QPixmapCache.remove(self._preview_cache_keys.pop(0))
+    
+    def _render_preview(self, rgba: np.ndarray, use_checkerboard: bool, scale: float):
+        """Composite rgba over the chosen background and show it at scale (keeps the view)."""
+        self._input_on_screen = False
         if use_checkerboard:
-            # Show with checkerboard pattern
-            self.preview_input.update_image_from_array_keep_view(rgba, use_checkerboard=True)
+            # Show with checkerboard pattern, blended against the cached board
+            self._blend_opaque(rgba, self._opaque_background(rgba.shape[:2], None))
+            self.preview_input.update_image_from_array_keep_view(
+                self._opaque_out, use_checkerboard=False, scale=scale
+            )
         elif self.bg_color is not None:
             # Show with solid color background
-            rgb = rgba[:, :, :3].astype(np.float32)
-            alpha = rgba[:, :, 3:4].astype(np.float32) / 255.0
-            
-            bg_color = np.array(self.bg_color, dtype=np.float32)
-            background = np.full_like(rgb, bg_color)
-            
-            result_rgb = rgb * alpha + background * (1 - alpha)
-            result_rgb = np.clip(result_rgb, 0, 255).astype(np.uint8)
-            
-            result = np.dstack([result_rgb, np.full((rgba.shape[0], rgba.shape[1]), 255, dtype=np.uint8)])
-            self.preview_input.update_image_from_array_keep_view(result, use_checkerboard=False)
+            if self.bg_color == (0, 0, 0):
+                self._blend_over_black(rgba)
+            else:
+                self._blend_opaque(rgba, self._opaque_background(rgba.shape[:2], self.bg_color))
+            self.preview_input.update_image_from_array_keep_view(
+                self._opaque_out, use_checkerboard=False, scale=scale
+            )
         else:
             # No color and no checkerboard - shouldn't happen, but show transparent
-            self.preview_input.update_image_from_array_keep_view(rgba, use_checkerboard=False)
+            self.preview_input.update_image_from_array_keep_view(rgba, use_checkerboard=False, scale=scale)
+    
+    def _ensure_opaque_out(self, shape: tuple):
+        """(Re)allocate _opaque_out and the blend weights when the preview shape changes."""
+        if self._opaque_out is None or self._opaque_out.shape != shape:
+            self._opaque_out = np.empty(shape, dtype=np.uint8)
+            self._blend_weights = np.empty((2,) + shape[:2], dtype=np.float32)
+            self._blend_weights_key = None
+    
+    def _blend_over_black(self, rgba: np.ndarray):
+        """Composite rgba over black into _opaque_out: just premultiplied RGB."""
+        self._ensure_opaque_out(rgba.shape)
+        
+        # fg * a / 255 is OpenCV's RGBA -> premultiplied conversion; no weights or
+        # background array needed
+        cv2.cvtColor(rgba, cv2.COLOR_RGBA2mRGBA, dst=self._opaque_out)
+        self._opaque_out[:, :, 3] = 255
+    
+    def _blend_opaque(self, rgba: np.ndarray, background: np.ndarray):
+        """Composite rgba over an opaque background into the reused _opaque_out buffer."""
+        self._ensure_opaque_out(rgba.shape)
+        
+        # Weights a and 255 - a depend only on the result, so a background change
+        # (color pick, checkerboard toggle) reuses them and only re-runs the blend
+        fg_weight, bg_weight = self._blend_weights
+        weights_key = (self._preview_generation, rgba.shape)
+        if self._blend_weights_key != weights_key:
+            np.copyto(fg_weight, rgba[:, :, 3])
+            np.subtract(255.0, fg_weight, out=bg_weight)
+            self._blend_weights_key = weights_key
+        
+        # OpenCV's blendLinear does (fg * a + bg * (255 - a)) / 255 in one threaded SIMD
+        # pass; it blends alpha too, so force the output opaque afterwards
+        cv2.blendLinear(rgba, background, fg_weight, bg_weight, dst=self._opaque_out)
+        self._opaque_out[:, :, 3] = 255
+    
+    def _opaque_background(self, shape: tuple, color: Optional[tuple]) -> np.ndarray:
+        """(H, W, 4) fill of color, or the widget's checkerboard if None, cached per size."""
+        key = (shape, color)
+        if self._background_key != key:
+            height, width = shape
+            background = np.empty((height, width, 4), dtype=np.uint8)
+            if color is None:
+                rows = (np.arange(height) // self.CHECKER_SIZE) & 1
+                cols = (np.arange(width) // self.CHECKER_SIZE) & 1
+                dark = (rows[:, None] ^ cols[None, :]) == 0
+                background[:, :, :3] = np.where(dark, 200, 255).astype(np.uint8)[:, :, None]
+                background[:, :, 3] = 255
+            else:
+                background[:] = color + (255,)
+            self._background_cache = background
+            self._background_key = key
+        return self._background_cache
+    
+    def _preview_lod_scale(self) -> float:
+        """Scale of the reduced preview, or 1.0 when the zoom needs full resolution."""
+        scale = min(1.0, self.PREVIEW_SIZE / max(self.transparent_result.shape[:2]))
+        return 1.0 if self.preview_input.zoom_factor > scale else scale
+    
+    def _preview_source(self, scale: float) -> np.ndarray:
+        """transparent_result reduced to scale, built once per result."""
+        if scale >= 1.0:
+            return self.transparent_result
+        
+        if self._preview_lod is None or self._preview_lod[0] != self._preview_generation:
+            height, width = self.transparent_result.shape[:2]
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            reduced = cv2.resize(self.transparent_result, size, interpolation=cv2.INTER_AREA)
+            self._preview_lod = (self._preview_generation, reduced, scale)
+        return self._preview_lod[1]
+    
+    def _on_preview_zoom_changed(self, zoom: float):
+        """Switch between the reduced and full-resolution preview as zoom crosses over."""
+        if self.transparent_result is None or self._interactive or self._input_on_screen:
+            return  # Mid-drag the proxy is on screen; release shows the full result
+        if self._preview_lod_scale() != self.preview_input.pixmap_scale:
+            self._update_preview_with_background()
+    
+    def _apply_pending_settings(self):
+        """Write slider values collected since the last reprocess into the settings."""
+        if self._pending_settings:
+            settings = self.view_model.settings
+            for name, value in self._pending_settings.items():
+                setattr(settings, name, value)
+            self._pending_settings.clear()
     
     def _reprocess_with_settings(self):
+        self._apply_pending_settings()
         if not hasattr(self, 'raw_mask') or self.raw_mask is None:
             return
         if not hasattr(self, 'original_image') or self.original_image is None:
             return
         
-        from src.domain.services.post_process_mask import PostProcessMask
-        from src.domain.services.alpha_compose import AlphaCompose
+        # Same slider values as the current result (e.g. re-tapping a value) -> nothing to do
+        settings_key = self._settings_key()
+        if settings_key == self._last_settings_key:
+            return
+        self._last_settings_key = settings_key
+        
+        if self._interactive and self._raw_mask_proxy is not None:
+            # Dragging: process the small proxy and show it as-is at its scale;
+            # transparent_result is only rebuilt at full size on release
+            processed_mask = PostProcessMask.apply(self._raw_mask_proxy, self._proxy_settings())
+            proxy = self._original_image_proxy
+            if self._proxy_compose_src is not proxy:
+                # Interleave RGB once per proxy; later drag ticks only rewrite alpha
+                self._proxy_compose_buf = AlphaCompose.compose(proxy, processed_mask).data
+                self._proxy_compose_src = proxy
+            else:
+                AlphaCompose.write_alpha(processed_mask, self._proxy_compose_buf)
+            
+            self._preview_generation += 1  # New alpha, so blend weights are stale
+            self._render_preview(
+                self._proxy_compose_buf,
+                self.chk_checkerboard.isChecked(),
+                proxy.width / self.original_image.width
+            )
+            return
+        
+        # Full resolution takes long enough to stall the UI, so run it on a worker thread
+        asyncio.ensure_future(self._reprocess_full_resolution(settings_key))
+    
+    async def _reprocess_full_resolution(self, settings_key: tuple):
+        """Post-process the full-size mask off the GUI thread and show the result."""
+        raw_mask, original_image = self.raw_mask, self.original_image
+        settings = replace(self.view_model.settings)  # Snapshot; sliders may move meanwhile
+        
+        output = await asyncio.to_thread(self._compose_result, raw_mask, original_image, settings)
         
-        processed_mask = PostProcessMask.apply(self.raw_mask, self.view_model.settings)
-        output = AlphaCompose.compose(self.original_image, processed_mask)
+        # A newer reprocess, a drag, or a reset has superseded this result
+        if settings_key != self._last_settings_key or raw_mask is not self.raw_mask:
+            return
         
-        self.transparent_result = output.data.copy()
+        self.transparent_result = output.data
+        self.transparent_result.flags.writeable = False
+        self._preview_generation += 1
         self._update_preview_with_background()
     
+    @staticmethod
+    def _compose_result(raw_mask: Mask, original_image: ImageInput, settings: Settings) -> ImageOutput:
+        """Apply mask post-processing and compose RGBA (runs off the GUI thread)."""
+        processed_mask = PostProcessMask.apply(raw_mask, settings)
+        return AlphaCompose.compose(original_image, processed_mask)
+    
+    def _settings_key(self) -> tuple:
+        """Post-processing inputs that determine transparent_result."""
+        settings = self.view_model.settings
+        return (
+            settings.threshold,
+            settings.smooth_pixels,
+            settings.feather_pixels,
+            self._interactive and self._raw_mask_proxy is not None
+        )
+    
+    def _prepare_result_buffers(self, result) -> tuple:
+        """
+        Build the derived arrays for a new result (runs off the GUI thread).
+        
+        Args:
+            result: RemoveBackgroundResult from the view model
+        
+        Returns:
+            (mask proxy, image proxy, (reduced preview, scale) or None); the proxies
+            are downscaled to PROXY_SIZE long edge for interactive slider previews
+        """
+        raw_mask, original_image = result.raw_mask, result.original_image
+        height, width = raw_mask.height, raw_mask.width
+        long_edge = max(height, width)
+        
+        reduced = None
+        preview_scale = self.PREVIEW_SIZE / long_edge
+        if preview_scale < 1.0:
+            size = (max(1, round(width * preview_scale)), max(1, round(height * preview_scale)))
+            reduced = (
+                cv2.resize(result.output.data, size, interpolation=cv2.INTER_AREA),
+                preview_scale
+            )
+        
+        scale = self.PROXY_SIZE / long_edge
+        if scale >= 1.0:
+            return raw_mask, original_image, reduced
+        
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        mask_small = cv2.resize(raw_mask.data, size, interpolation=cv2.INTER_AREA)
+        image_small = cv2.resize(original_image.data, size, interpolation=cv2.INTER_AREA)
+        
+        mask_proxy = Mask(
+            data=mask_small,
+            width=size[0],
+            height=size[1],
+            is_binary=raw_mask.is_binary
+        )
+        image_proxy = ImageInput(
+            data=image_small,
+            width=size[0],
+            height=size[1],
+            file_path=original_image.file_path
+        )
+        return mask_proxy, image_proxy, reduced
+    
+    def _proxy_settings(self):
+        """Settings with pixel radii scaled down to the proxy resolution."""
+        settings = self.view_model.settings
+        scale = self._raw_mask_proxy.width / self.raw_mask.width
+        return replace(
+            settings,
+            smooth_pixels=round(settings.smooth_pixels * scale),
+            feather_pixels=round(settings.feather_pixels * scale)
+        )
+    
     def _on_save_image(self):
         """Save PNG - copy from original."""
         if not self.view_model.last_result:
@@ -797,7 +1258,7 @@ class MainWindowNew(QMainWindow):
         """Save image asynchronously."""
         t = self.translator.t
         try:
-            await self.view_model.save_output(path)
+            await asyncio.to_thread(asyncio.run, self.view_model.save_output(path))
             self.status_bar.showMessage(f"{t('image_saved')} {path}")
             QMessageBox.information(self, t('success'), f"{t('image_saved')}\n{path}")
         except Exception as e:
@@ -808,23 +1269,36 @@ class MainWindowNew(QMainWindow):
         if not self.input_image_path or not self.view_model.last_result:
             return
         
-        # Ask for mask format
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QRadioButton, QDialogButtonBox
+        # Ask for mask format; the dialog is kept so the last choice is remembered
+        if self._mask_fmt_dialog is None:
+            self._mask_fmt_dialog = self._build_mask_format_dialog()
         
-        t = self.translator.t
+        if self._mask_fmt_dialog.exec() == QDialog.DialogCode.Accepted:
+            # Determine format
+            if self.radio_mask_grayscale.isChecked():
+                format_type = "grayscale"
+            elif self.radio_mask_binary.isChecked():
+                format_type = "binary"
+            else:
+                format_type = "alpha"
+            
+            asyncio.create_task(self._export_mask(format_type))
+    
+    def _build_mask_format_dialog(self) -> QDialog:
+        """Create mask format dialog (grayscale / binary / alpha)."""
         dialog = QDialog(self)
-        dialog.setWindowTitle(t('export_mask_format'))
         layout = QVBoxLayout(dialog)
         
-        layout.addWidget(QLabel(t('select_mask_format')))
-        radio_grayscale = QRadioButton(t('grayscale'))
-        radio_binary = QRadioButton(t('binary'))
-        radio_alpha = QRadioButton(t('alpha_channel'))
-        radio_grayscale.setChecked(True)
+        self.lbl_mask_format = QLabel()
+        self.radio_mask_grayscale = QRadioButton()
+        self.radio_mask_binary = QRadioButton()
+        self.radio_mask_alpha = QRadioButton()
+        self.radio_mask_grayscale.setChecked(True)
         
-        layout.addWidget(radio_grayscale)
-        layout.addWidget(radio_binary)
-        layout.addWidget(radio_alpha)
+        layout.addWidget(self.lbl_mask_format)
+        layout.addWidget(self.radio_mask_grayscale)
+        layout.addWidget(self.radio_mask_binary)
+        layout.addWidget(self.radio_mask_alpha)
         
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
@@ -833,21 +1307,20 @@ class MainWindowNew(QMainWindow):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Determine format
-            if radio_grayscale.isChecked():
-                format_type = "grayscale"
-            elif radio_binary.isChecked():
-                format_type = "binary"
-            else:
-                format_type = "alpha"
-            
-            asyncio.create_task(self._export_mask(format_type))
+        self._retranslate_mask_format_dialog(dialog)
+        return dialog
+    
+    def _retranslate_mask_format_dialog(self, dialog: QDialog):
+        """Set mask format dialog text in the current language."""
+        t = self.translator.t
+        dialog.setWindowTitle(t('export_mask_format'))
+        self.lbl_mask_format.setText(t('select_mask_format'))
+        self.radio_mask_grayscale.setText(t('grayscale'))
+        self.radio_mask_binary.setText(t('binary'))
+        self.radio_mask_alpha.setText(t('alpha_channel'))
     
     async def _export_mask(self, format_type: str):
         """Export mask asynchronously."""
-        from src.application.use_cases.export_mask_use_case import ExportMaskUseCase
-        
         try:
             # Create use case
             export_use_case = ExportMaskUseCase(
@@ -900,6 +1373,10 @@ class MainWindowNew(QMainWindow):
     
     def _on_batch_process(self):
         """Batch process - copy from original."""
+        if self._batch_in_flight:
+            self.status_bar.showMessage("Batch processing is already running")
+            return
+        
         # Select input folder
         input_folder = QFileDialog.getExistingDirectory(
             self,
@@ -920,13 +1397,13 @@ class MainWindowNew(QMainWindow):
         if not output_folder:
             return
         
-        # Find all image files
-        input_path = Path(input_folder)
-        image_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.bmp'}
-        image_files = [
-            f for f in input_path.iterdir()
-            if f.suffix.lower() in image_extensions
-        ]
+        # Find all image files (DirEntry.is_file uses the cached scan result)
+        with os.scandir(input_folder) as entries:
+            image_files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS
+            ]
         
         if not image_files:
             QMessageBox.warning(
@@ -947,117 +1424,99 @@ class MainWindowNew(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            asyncio.create_task(
-                self._run_batch_process(image_files, Path(output_folder))
-            )
+            self._run_batch_process(image_files, Path(output_folder))
     
-    async def _run_batch_process(self, image_files: List[Path], output_folder: Path):
-        """Run batch processing."""
-        from src.application.use_cases.batch_process_use_case import BatchProcessUseCase
+    def _run_batch_process(self, image_files: List[Path], output_folder: Path):
+        """Run batch processing on a QThreadPool worker."""
+        BatchWorker = _get_batch_worker()
+        self._apply_pending_settings()
         
-        # Create batch use case
-        batch_use_case = BatchProcessUseCase(
-            engine=self.view_model.use_case.engine,
-            image_io=self.view_model.use_case.image_io,
-            settings=self.view_model.settings,
-            max_workers=4
-        )
+        batch_use_case = self.view_model.get_batch_use_case(self.BATCH_CACHE_FOLDER)
         
-        # Create progress dialog
-        progress_dialog = QMessageBox(self)
+        # Create progress dialog (non-modal, single integer update per file)
+        progress_dialog = QProgressDialog(
+            "Processing images...", "Cancel", 0, len(image_files), self
+        )
         progress_dialog.setWindowTitle("Batch Processing")
-        progress_dialog.setText("Processing images...")
-        progress_dialog.setStandardButtons(QMessageBox.StandardButton.NoButton)
-        progress_dialog.show()
-        
-        async def progress_callback(progress):
-            """Update progress dialog."""
-            progress_dialog.setText(
-                f"Processing: {progress.current_file}\n"
-                f"Completed: {progress.completed}/{progress.total}\n"
-                f"Failed: {progress.failed}\n"
-                f"Progress: {progress.percentage:.1f}%\n"
-                f"ETA: {progress.eta_ms/1000:.1f}s"
-            )
-        
-        try:
-            result = await batch_use_case.execute(
-                image_paths=image_files,
-                output_folder=output_folder,
-                progress_callback=progress_callback
-            )
-            
-            progress_dialog.close()
-            
-            # Show summary
-            QMessageBox.information(
-                self,
-                "Batch Complete",
-                f"Batch processing complete!\n\n"
-                f"Total: {result.total}\n"
-                f"Successful: {result.successful}\n"
-                f"Failed: {result.failed}\n"
-                f"Success rate: {result.success_rate:.1f}%\n"
-                f"Total time: {result.total_time_ms/1000:.1f}s\n\n"
-                f"Output folder: {output_folder}"
-            )
-            
-        except Exception as e:
-            progress_dialog.close()
+        progress_dialog.setWindowModality(Qt.WindowModality.NonModal)
+        progress_dialog.setMinimumDuration(500)
+        progress_dialog.setValue(0)
+        
+        worker = BatchWorker(batch_use_case, image_files, output_folder)
+        
+        # Sample the worker's counter at ~30 Hz instead of repainting per image
+        progress_timer = QTimer(self)
+        progress_timer.timeout.connect(lambda: progress_dialog.setValue(worker.processed))
+        progress_timer.start(33)
+        
+        def finish_batch():
+            """Stop progress updates and dispose of the dialog exactly once."""
+            self._batch_in_flight = False
+            progress_timer.stop()
+            progress_timer.deleteLater()
+            if not sip.isdeleted(progress_dialog):
+                # reset() also stops the pending minimum-duration show of a short batch
+                progress_dialog.reset()
+                progress_dialog.deleteLater()
+        
+        def on_finished(result):
+            """Show summary."""
+            finish_batch()
+            QMessageBox.information(self, "Batch Complete", result.summary_text)
+        
+        def on_failed(message: str):
+            """Show batch error."""
+            finish_batch()
             QMessageBox.critical(
                 self,
                 "Batch Error",
-                f"Batch processing failed:\n{str(e)}"
+                f"Batch processing failed:\n{message}"
             )
+        
+        def on_cancelled():
+            """Report cancellation."""
+            finish_batch()
+            self.status_bar.showMessage("Batch processing cancelled")
+        
+        # Results arrive on the GUI thread through queued signals
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(on_failed)
+        worker.signals.cancelled.connect(on_cancelled)
+        progress_dialog.canceled.connect(worker.cancel)
+        
+        self._batch_worker = worker  # Keep signals alive while the batch runs
+        self._batch_in_flight = True
+        QThreadPool.globalInstance().start(worker)
     
     def _on_reset(self):
         """Reset to original image."""
+        # Apply all widget changes below with a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._reset_state()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+    
+    def _reset_state(self):
+        """Clear results and restore controls (called with updates disabled)."""
+        self._input_load_id += 1  # Any input decode still running is stale now
+        
+        # Clear processed data first, so fitting the restored input can't redraw it
+        self._clear_result()
+        
         if self.input_image_path and self.input_image_path.exists():
-            # Restore original image
-            pixmap = QPixmap(str(self.input_image_path))
-            self.preview_input.set_image(pixmap, use_checkerboard=False)
-            self.preview_input.fit_to_view()
-            
-            # Clear processed data
-            self.transparent_result = None
-            self.raw_mask = None
-            self.original_image = None
-            
-            # Change button back to Remove Background mode
-            self.btn_process.setText(self.translator.t('remove_background').upper())
-            self.btn_process.setProperty('is_reset_mode', False)
-            self.btn_process.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #3498db, stop:1 #2ecc71);
-                    color: white;
-                    font-size: 20px;
-                    font-weight: bold;
-                    border: none;
-                    border-radius: 10px;
-                    padding: 15px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #2980b9, stop:1 #27ae60);
-                }
-            """)
+            # Restore original image - normally still decoded in QPixmapCache,
+            # otherwise decoded off the GUI thread like a fresh open
+            if not self._show_cached_input(self.input_image_path):
+                asyncio.ensure_future(
+                    self._restore_input(self.input_image_path, self._input_load_id)
+                )
             self.btn_process.setEnabled(True)
-            
-            # Disable save buttons
-            self.btn_save.setEnabled(False)
-            self.btn_pick_color.setEnabled(False)
-            
-            # Reset info
-            self.lbl_info.setText(self.translator.t('no_image_processed'))
-            self.status_bar.showMessage(self.translator.t('status_ready'))
         else:
             # No image - full reset
             self.input_image_path = None
             self.output_image_path = None
-            self.transparent_result = None
-            self.raw_mask = None
-            self.original_image = None
             
             self.preview_input.clear_image()
             
@@ -1065,12 +1524,52 @@ class MainWindowNew(QMainWindow):
             self.drop_area.show()
             
             self.btn_process.setEnabled(False)
-            self.btn_save.setEnabled(False)
-            self.btn_pick_color.setEnabled(False)
         
         self.lbl_info.setText(self.translator.t('no_image_processed'))
         self.status_bar.showMessage(self.translator.t('status_ready'))
     
+    def _clear_result(self):
+        """Drop the processed result and put the controls back into Remove Background mode."""
+        self._release_buffers()
+        
+        # Change button back to Remove Background mode
+        self.btn_process.setText(self.translator.t('remove_background').upper())
+        self.btn_process.setProperty('is_reset_mode', False)
+        self._repolish(self.btn_process)
+        
+        # Disable save buttons
+        for button in (self.btn_save, self.btn_pick_color):
+            button.setEnabled(False)
+    
+    def _release_buffers(self):
+        """Drop processed image buffers so the next image starts from a low RSS."""
+        self.transparent_result = None
+        self._preview_generation += 1  # Cached previews and blend weights are stale
+        self.raw_mask = None
+        self.original_image = None
+        self._raw_mask_proxy = None
+        self._original_image_proxy = None
+        self._proxy_compose_buf = None
+        self._proxy_compose_src = None
+        self._opaque_out = None
+        self._blend_weights = None
+        self._blend_weights_key = None
+        self._preview_lod = None
+        self._background_cache = None
+        self._background_key = None
+        self._last_settings_key = None
+        self.view_model.last_result = None
+        
+        # Drop result previews but keep decoded inputs for a quick re-open
+        for cache_key in self._preview_cache_keys:
+            QPixmapCache.remove(cache_key)
+        self._preview_cache_keys.clear()
+        
+        # Arrays are freed by refcount; only collect when many Python objects piled up
+        if sys.getallocatedblocks() > self._gc_block_baseline * self.GC_GROWTH_FACTOR:
+            gc.collect()
+            self._gc_block_baseline = sys.getallocatedblocks()
+    
     def _on_language_changed(self, index: int):
         """Handle language change."""
         lang_code = self.lang_selector.itemData(index)
@@ -1079,6 +1578,7 @@ class MainWindowNew(QMainWindow):
     
     def _refresh_ui_text(self):
         """Refresh all UI text with current language."""
+        self._ensure_controls_built()
         t = self.translator.t
         
         # Window title
@@ -1118,6 +1618,7 @@ class MainWindowNew(QMainWindow):
         self.chk_checkerboard.setText(t('checkerboard'))
         
         # Adjustment labels
+        self._apply_pending_settings()
         self.lbl_threshold_title.setText(t('threshold'))
         self.lbl_smooth_title.setText(t('smooth'))
         self.lbl_feather_title.setText(t('feather'))
@@ -1131,6 +1632,10 @@ class MainWindowNew(QMainWindow):
         # Checkbox
         self.chk_auto_crop.setText(t('auto_crop'))
         
+        # Mask format dialog, if already built
+        if self._mask_fmt_dialog is not None:
+            self._retranslate_mask_format_dialog(self._mask_fmt_dialog)
+        
         # Info text
         if not self.view_model.last_result:
             self.lbl_info.setText(t('no_image_processed'))
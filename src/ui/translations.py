@@ -54,6 +54,7 @@ TRANSLATIONS = {
         'bg_color_preview': '🎨 BACKGROUND COLOR PREVIEW',
         'preview_with': 'Preview with:',
         'pick_color': 'Pick Color',
+        'pick_color_tooltip': 'Click to pick color, double-click to clear',
         'clear': 'Clear',
         
         # Options
@@ -173,6 +174,7 @@ TRANSLATIONS = {
         'bg_color_preview': '🎨 XEM MÀU PHÔNG NỀN',
         'preview_with': 'Xem với:',
         'pick_color': 'Chọn màu',
+        'pick_color_tooltip': 'Nhấn để chọn màu, nhấn đúp để xóa',
         'clear': 'Xóa',
         
         # Options
@@ -240,6 +242,11 @@ TRANSLATIONS = {
     }
 }
 
+# Keys whose text has {placeholders}; only these need str.format
+_FORMAT_KEYS = frozenset(
+    key for table in TRANSLATIONS.values() for key, text in table.items() if '{' in text
+)
+
 
 class Translator:
     """Simple translator class."""
@@ -247,17 +254,20 @@ class Translator:
     def __init__(self, language: str = 'en'):
         """Initialize translator."""
         self.current_language = language
+        # Table of the current language, so a lookup is a single dict.get
+        self._table = TRANSLATIONS.get(language, TRANSLATIONS['en'])
     
     def set_language(self, language: str):
         """Set current language."""
         if language in TRANSLATIONS:
             self.current_language = language
+            self._table = TRANSLATIONS[language]
     
     def get(self, key: str, **kwargs) -> str:
         """Get translated text."""
-        text = TRANSLATIONS.get(self.current_language, {}).get(key, key)
+        text = self._table.get(key) or TRANSLATIONS['en'].get(key, key)
         # Support for string formatting
-        if kwargs:
+        if kwargs and key in _FORMAT_KEYS:
             text = text.format(**kwargs)
         return text
     
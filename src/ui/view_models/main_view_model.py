@@ -31,6 +31,7 @@ class MainViewModel:
         self.image_io = image_io
         self.settings = settings
         self.last_result: Optional[RemoveBackgroundResult] = None
+        self._batch_use_case = None  # Created on first batch run, then reused
     
     async def remove_background(self, image_path: Path) -> RemoveBackgroundResult:
         """
@@ -57,3 +58,27 @@ class MainViewModel:
             raise ValueError("No result to save")
         
         await self.image_io.save_png_rgba(self.last_result.output, output_path)
+    
+    def get_batch_use_case(self, cache_folder: Optional[Path] = None):
+        """
+        Get the batch use case, creating it on first use.
+        
+        It shares this view model's engine, image I/O and settings object, so later
+        batches pick up changed settings without being rebuilt.
+        
+        Args:
+            cache_folder: Folder for the batch result cache (None = no cache)
+        
+        Returns:
+            BatchProcessUseCase
+        """
+        if self._batch_use_case is None or self._batch_use_case.cache_folder != cache_folder:
+            # Imported here so sessions that never batch don't load it
+            from src.application.use_cases.batch_process_use_case import BatchProcessUseCase
+            self._batch_use_case = BatchProcessUseCase(
+                engine=self.use_case.engine,
+                image_io=self.use_case.image_io,
+                settings=self.settings,
+                cache_folder=cache_folder
+            )
+        return self._batch_use_case
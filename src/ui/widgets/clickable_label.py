@@ -0,0 +1,23 @@
+"""QLabel that reports mouse clicks as signals."""
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QMouseEvent
+
+
+class ClickableLabel(QLabel):
+    """Label emitting clicked / double_clicked for left-button presses."""
+    
+    clicked = pyqtSignal()
+    double_clicked = pyqtSignal()
+    
+    def mousePressEvent(self, event: QMouseEvent):
+        """Emit clicked on left press."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+    
+    def mouseDoubleClickEvent(self, event: QMouseEvent):
+        """Emit double_clicked on left double-click."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.double_clicked.emit()
+        super().mouseDoubleClickEvent(event)
@@ -1,13 +1,49 @@
 """Image preview widget with checkerboard background."""
+from collections import OrderedDict
+
 from PyQt6.QtWidgets import QLabel, QSizePolicy
-from PyQt6.QtCore import Qt, QPoint, QRect
-from PyQt6.QtGui import QPixmap, QPainter, QImage, QPen, QColor, QWheelEvent, QMouseEvent, QPaintEvent
+from PyQt6.QtCore import Qt, QPoint, QRect, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QPixmap, QPainter, QImage, QPen, QColor, QBrush, QWheelEvent, QMouseEvent, QPaintEvent
+)
 import numpy as np
 
 
+# Channel count -> (bytes per pixel, QImage format) for ndarray previews
+_FMT = {
+    1: (1, QImage.Format.Format_Grayscale8),
+    3: (3, QImage.Format.Format_RGB888),
+    4: (4, QImage.Format.Format_RGBA8888),
+}
+
+CHECKER_SIZE = 16
+BACKGROUND_COLOR = QColor(240, 240, 240)
+_CHECKER_BRUSH: QBrush | None = None
+
+
+def _checker_brush() -> QBrush:
+    """Return the checkerboard brush (one 2x2-cell tile), built on first use."""
+    global _CHECKER_BRUSH
+    if _CHECKER_BRUSH is None:
+        # Needs a QGuiApplication, so it can't be built at import time
+        tile = QPixmap(CHECKER_SIZE * 2, CHECKER_SIZE * 2)
+        tile.fill(QColor(255, 255, 255))
+        painter = QPainter(tile)
+        painter.fillRect(0, 0, CHECKER_SIZE, CHECKER_SIZE, QColor(200, 200, 200))
+        painter.fillRect(CHECKER_SIZE, CHECKER_SIZE, CHECKER_SIZE, CHECKER_SIZE, QColor(200, 200, 200))
+        painter.end()
+        _CHECKER_BRUSH = QBrush(tile)
+    return _CHECKER_BRUSH
+
+
 class ImagePreviewWidget(QLabel):
     """Image preview with checkerboard background, zoom, and pan."""
     
+    zoom_changed = pyqtSignal(float)
+    
+    SETTLE_MS = 150  # Wheel quiet time before the smooth re-scale
+    SCALED_CACHE_SIZE = 4  # Smooth-scaled pixmaps kept for zooming back and forth
+    
     def __init__(self, parent=None):
         """Initialize preview widget."""
         super().__init__(parent)
@@ -19,6 +55,7 @@ class ImagePreviewWidget(QLabel):
         # Original image data
         self.original_pixmap: QPixmap | None = None
         self.show_checkerboard = False
+        self.pixmap_scale = 1.0  # Pixmap pixels per image pixel (< 1 for reduced previews)
         
         # Zoom and pan
         self.zoom_factor = 1.0
@@ -27,13 +64,49 @@ class ImagePreviewWidget(QLabel):
         self.pan_offset = QPoint(0, 0)
         self.last_pan_point = QPoint()
         self.is_panning = False
+        self._paint_pending = False  # A pan repaint is queued but not yet painted
         
-        # Cached display pixmap
+        # Cached display pixmap and the inputs it was scaled from
         self.display_pixmap: QPixmap | None = None
+        self._last_display_key: tuple | None = None
+        
+        # Reused for non-contiguous input arrays (e.g. cropped or channel views)
+        self._scratch: np.ndarray | None = None
+        
+        # Checkerboard composite of original_pixmap, keyed on its cacheKey()
+        self._checker_cache_key: int | None = None
+        self._checker_cache_pixmap: QPixmap | None = None
+        
+        # Smooth-scaled display pixmaps of the current base pixmap, keyed on zoom
+        self._scaled_cache: OrderedDict[float, QPixmap] = OrderedDict()
+        self._scaled_cache_base: int | None = None
+        
+        # Halved copies of the base pixmap (index k = 1/2**k), built as zoom needs them
+        self._mips: list[QPixmap] = []
+        self._mips_base: int | None = None
+        
+        # Fast scaling while the wheel is turning, smooth once it settles
+        self._interactive = False
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(self.SETTLE_MS)
+        self._settle_timer.timeout.connect(self._on_zoom_settled)
+        
+        # Coalesces bursts of zoom steps into one update_display per event-loop pass
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.update_display)
         
         # Enable mouse tracking
         self.setMouseTracking(True)
         self.setStyleSheet("border: 1px solid #ddd;")
+        
+        # Background is filled by Qt before paintEvent, not by an extra fillRect per paint
+        palette = self.palette()
+        palette.setColor(self.backgroundRole(), BACKGROUND_COLOR)
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
     
     def set_image(self, pixmap: QPixmap, use_checkerboard: bool = False):
         """
@@ -45,6 +118,7 @@ class ImagePreviewWidget(QLabel):
         """
         self.original_pixmap = pixmap
         self.show_checkerboard = use_checkerboard
+        self.pixmap_scale = 1.0
         self.zoom_factor = 1.0
         self.pan_offset = QPoint(0, 0)
         self.update_display()
@@ -57,158 +131,239 @@ class ImagePreviewWidget(QLabel):
             image_array: Image array (RGB or RGBA)
             use_checkerboard: Whether to show checkerboard background
         """
-        height, width = image_array.shape[:2]
-        channels = image_array.shape[2] if image_array.ndim == 3 else 1
+        qimage = self._ndarray_to_qimage(image_array)
         
-        if channels == 4:
-            # RGBA
-            bytes_per_line = 4 * width
-            qimage = QImage(
-                image_array.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGBA8888
-            )
-        elif channels == 3:
-            # RGB
-            bytes_per_line = 3 * width
-            qimage = QImage(
-                image_array.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888
-            )
-        else:
-            # Grayscale
-            bytes_per_line = width
-            qimage = QImage(
-                image_array.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_Grayscale8
-            )
-        
-        pixmap = QPixmap.fromImage(qimage.copy())
+        # fromImage copies the pixels, image_array only has to outlive this call
+        pixmap = QPixmap.fromImage(qimage)
         self.set_image(pixmap, use_checkerboard)
     
-    def update_image_keep_view(self, pixmap: QPixmap, use_checkerboard: bool = False):
+    def update_image_keep_view(
+        self,
+        pixmap: QPixmap,
+        use_checkerboard: bool = False,
+        scale: float = 1.0
+    ):
         """
         Update image while preserving zoom and pan state.
         
         Args:
             pixmap: New image to display
             use_checkerboard: Whether to show checkerboard background
+            scale: Pixmap size relative to the image it stands for (zoom stays in image pixels)
         """
         self.original_pixmap = pixmap
         self.show_checkerboard = use_checkerboard
+        self.pixmap_scale = scale
         # Don't reset zoom_factor and pan_offset!
         self.update_display()
     
-    def update_image_from_array_keep_view(self, image_array: np.ndarray, use_checkerboard: bool = False):
+    def update_image_from_array_keep_view(
+        self,
+        image_array: np.ndarray,
+        use_checkerboard: bool = False,
+        scale: float = 1.0
+    ):
         """
         Update image from numpy array while preserving zoom and pan state.
         
         Args:
             image_array: Image array (RGB or RGBA)
             use_checkerboard: Whether to show checkerboard background
+            scale: Array size relative to the image it stands for
         """
+        qimage = self._ndarray_to_qimage(image_array)
+        
+        # fromImage copies the pixels, image_array only has to outlive this call
+        pixmap = QPixmap.fromImage(qimage)
+        self.update_image_keep_view(pixmap, use_checkerboard, scale)
+    
+    def _ndarray_to_qimage(self, image_array: np.ndarray) -> QImage:
+        """Wrap a uint8 (H, W), (H, W, 3) or (H, W, 4) array in a QImage without copying."""
+        # QImage wraps the buffer as-is, so it must be C-contiguous
+        image_array = self._contiguous(image_array)
         height, width = image_array.shape[:2]
         channels = image_array.shape[2] if image_array.ndim == 3 else 1
         
-        if channels == 4:
-            # RGBA
-            bytes_per_line = 4 * width
-            qimage = QImage(
-                image_array.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGBA8888
-            )
-        elif channels == 3:
-            # RGB
-            bytes_per_line = 3 * width
-            qimage = QImage(
-                image_array.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888
-            )
-        else:
-            # Grayscale
-            bytes_per_line = width
-            qimage = QImage(
-                image_array.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_Grayscale8
-            )
-        
-        pixmap = QPixmap.fromImage(qimage.copy())
-        self.update_image_keep_view(pixmap, use_checkerboard)
+        bytes_per_pixel, image_format = _FMT[channels]
+        return QImage(image_array.data, width, height, bytes_per_pixel * width, image_format)
+    
+    def _contiguous(self, image_array: np.ndarray) -> np.ndarray:
+        """Return image_array if C-contiguous, else a copy in the reused scratch buffer."""
+        if image_array.flags.c_contiguous:
+            return image_array
+        
+        if (
+            self._scratch is None
+            or self._scratch.shape != image_array.shape
+            or self._scratch.dtype != image_array.dtype
+        ):
+            self._scratch = np.empty(image_array.shape, dtype=image_array.dtype)
+        np.copyto(self._scratch, image_array)
+        return self._scratch
     
     def clear_image(self):
         """Clear displayed image."""
+        # Drop both pixmaps so their pixel memory is released, not just hidden
         self.original_pixmap = None
+        self.display_pixmap = None
+        self._checker_cache_key = None
+        self._checker_cache_pixmap = None
+        self._scratch = None
+        self._scaled_cache.clear()
+        self._scaled_cache_base = None
+        self._mips = []
+        self._mips_base = None
         self.clear()
         self.setText("No image loaded")
     
     def update_display(self):
         """Update the displayed image with zoom and pan."""
+        self._update_timer.stop()  # Covers any scheduled update
         if self.original_pixmap is None:
             return
         
-        # Create a pixmap with checkerboard if needed
-        if self.show_checkerboard:
-            base_pixmap = self._create_checkerboard_image(self.original_pixmap)
+        # Same pixmap, zoom, mode and screen as the pixmap on display -> nothing to
+        # re-scale, but still repaint: callers such as fit/reset may have moved the pan
+        dpr = self.devicePixelRatioF()
+        display_key = (
+            self.original_pixmap.cacheKey(),
+            self.zoom_factor,
+            self.pixmap_scale,
+            self.show_checkerboard,
+            dpr,
+            self._interactive
+        )
+        if display_key == self._last_display_key and self.display_pixmap is not None:
+            self._redraw()
+            return
+        
+        # Create a pixmap with checkerboard if needed (composited once per pixmap,
+        # zoom steps reuse it); an opaque pixmap would hide it completely
+        if self.show_checkerboard and self.original_pixmap.hasAlphaChannel():
+            base_pixmap = self._checkerboard_pixmap()
         else:
             base_pixmap = self.original_pixmap
         
-        # Apply zoom
-        scaled_size = base_pixmap.size() * self.zoom_factor
-        self.display_pixmap = base_pixmap.scaled(
+        # Apply zoom (zoom_factor is relative to the full-size image), scaling straight
+        # to device pixels and tagging the result with the DPR, so HiDPI screens don't
+        # upscale (and blur) the pixmap again on every paint
+        self.display_pixmap = self._scaled_pixmap(base_pixmap, self.zoom_factor / self.pixmap_scale * dpr)
+        self.display_pixmap.setDevicePixelRatio(dpr)
+        self._last_display_key = display_key
+        
+        # Trigger repaint
+        self._redraw()
+    
+    def _redraw(self):
+        """
+        Repaint the current display_pixmap without re-scaling it.
+        
+        High-rate mice report far faster than the screen refreshes, so only one
+        repaint is requested until paintEvent has run; offsets keep accumulating.
+        """
+        if not self._paint_pending:
+            self._paint_pending = True
+            self.update()
+    
+    def _scaled_pixmap(self, base_pixmap: QPixmap, ratio: float) -> QPixmap:
+        """
+        Scale base_pixmap for display.
+        
+        Args:
+            base_pixmap: Pixmap to scale (original or checkerboard composite)
+            ratio: Device pixels per pixmap pixel
+        
+        Returns:
+            Scaled pixmap, taken from the nearest mip level; nearest-neighbour while the
+            wheel is turning, otherwise smooth and cached per zoom so stepping back to a
+            level is free
+        """
+        scaled_size = base_pixmap.size() * ratio
+        if self._interactive:
+            return self._mip_level(base_pixmap, ratio).scaled(
+                scaled_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation
+            )
+        
+        base_key = base_pixmap.cacheKey()
+        if base_key != self._scaled_cache_base:
+            self._scaled_cache.clear()  # Different image, old scales are useless
+            self._scaled_cache_base = base_key
+        
+        scaled = self._scaled_cache.get(ratio)
+        if scaled is not None:
+            self._scaled_cache.move_to_end(ratio)
+            return scaled
+        
+        scaled = self._mip_level(base_pixmap, ratio).scaled(
             scaled_size,
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation
         )
+        self._scaled_cache[ratio] = scaled
+        if len(self._scaled_cache) > self.SCALED_CACHE_SIZE:
+            self._scaled_cache.popitem(last=False)
+        return scaled
+    
+    def _mip_level(self, base_pixmap: QPixmap, ratio: float) -> QPixmap:
+        """
+        Pick the smallest halved copy of base_pixmap that is still >= the target size.
         
-        # Trigger repaint
-        self.update()
+        Args:
+            base_pixmap: Full pixmap being displayed
+            ratio: Display pixels per base pixel
+        
+        Returns:
+            base_pixmap itself when ratio > 0.5, otherwise a cached 1/2**k copy, so
+            zoomed-out scales read a fraction of the pixels
+        """
+        if ratio > 0.5:
+            return base_pixmap
+        
+        base_key = base_pixmap.cacheKey()
+        if base_key != self._mips_base:
+            self._mips = [base_pixmap]
+            self._mips_base = base_key
+        
+        level = 0
+        while ratio * 2 ** (level + 1) <= 1.0:
+            level += 1
+            if level == len(self._mips):
+                previous = self._mips[-1]
+                if min(previous.width(), previous.height()) < 2:
+                    break
+                self._mips.append(previous.scaled(
+                    previous.width() // 2,
+                    previous.height() // 2,
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                ))
+        return self._mips[min(level, len(self._mips) - 1)]
+    
+    def _checkerboard_pixmap(self) -> QPixmap:
+        """Return original_pixmap over the checkerboard, cached until the pixmap changes."""
+        key = self.original_pixmap.cacheKey()
+        if key != self._checker_cache_key:
+            self._checker_cache_pixmap = self._create_checkerboard_image(self.original_pixmap)
+            self._checker_cache_key = key
+        return self._checker_cache_pixmap
     
     def _create_checkerboard_image(self, pixmap: QPixmap) -> QPixmap:
         """
         Create image with checkerboard background for transparency.
         
         Args:
-            pixmap: Original image (should have alpha channel)
+            pixmap: Original image; only worth calling when it has an alpha channel
             
         Returns:
             Image with checkerboard background
         """
-        # Create checkerboard pattern
-        checker_size = 16
-        width = pixmap.width()
-        height = pixmap.height()
-        
-        result = QPixmap(width, height)
+        result = QPixmap(pixmap.width(), pixmap.height())
         painter = QPainter(result)
         
-        # Draw checkerboard
-        color1 = QColor(200, 200, 200)
-        color2 = QColor(255, 255, 255)
-        
-        for y in range(0, height, checker_size):
-            for x in range(0, width, checker_size):
-                # Alternate colors
-                if ((x // checker_size) + (y // checker_size)) % 2 == 0:
-                    painter.fillRect(x, y, checker_size, checker_size, color1)
-                else:
-                    painter.fillRect(x, y, checker_size, checker_size, color2)
+        # Draw checkerboard - Qt tiles the brush natively in a single call
+        painter.fillRect(result.rect(), _checker_brush())
         
         # Draw image on top
         painter.drawPixmap(0, 0, pixmap)
@@ -225,28 +380,32 @@ class ImagePreviewWidget(QLabel):
         pixmap_size = self.original_pixmap.size()
         widget_size = self.size()
         
-        width_ratio = widget_size.width() / pixmap_size.width()
-        height_ratio = widget_size.height() / pixmap_size.height()
+        width_ratio = widget_size.width() * self.pixmap_scale / pixmap_size.width()
+        height_ratio = widget_size.height() * self.pixmap_scale / pixmap_size.height()
         
         self.zoom_factor = min(width_ratio, height_ratio, 1.0)
         self.pan_offset = QPoint(0, 0)
         self.update_display()
+        self.zoom_changed.emit(self.zoom_factor)
     
     def reset_zoom(self):
         """Reset zoom to 100%."""
         self.zoom_factor = 1.0
         self.pan_offset = QPoint(0, 0)
         self.update_display()
+        self.zoom_changed.emit(self.zoom_factor)
     
     def zoom_in(self):
         """Zoom in by 25%."""
         self.zoom_factor = min(self.zoom_factor * 1.25, self.max_zoom)
-        self.update_display()
+        self._schedule_update()
+        self.zoom_changed.emit(self.zoom_factor)
     
     def zoom_out(self):
         """Zoom out by 25%."""
         self.zoom_factor = max(self.zoom_factor / 1.25, self.min_zoom)
-        self.update_display()
+        self._schedule_update()
+        self.zoom_changed.emit(self.zoom_factor)
     
     def wheelEvent(self, event: QWheelEvent):
         """Handle mouse wheel for zooming."""
@@ -256,11 +415,25 @@ class ImagePreviewWidget(QLabel):
         # Get wheel delta
         delta = event.angleDelta().y()
         
+        # Cheap scaling for the burst of wheel steps; smooth pass once it stops
+        self._interactive = True
+        self._settle_timer.start()
+        
         if delta > 0:
             self.zoom_in()
         else:
             self.zoom_out()
     
+    def _schedule_update(self):
+        """Request update_display on the next event-loop pass (repeat calls coalesce)."""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    def _on_zoom_settled(self):
+        """Re-scale smoothly once wheel zooming has stopped."""
+        self._interactive = False
+        self.update_display()
+    
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press for panning."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -272,9 +445,13 @@ class ImagePreviewWidget(QLabel):
         """Handle mouse move for panning."""
         if self.is_panning and self.display_pixmap:
             delta = event.pos() - self.last_pan_point
+            if delta.isNull():
+                return  # Sub-pixel move, nothing to redraw
             self.pan_offset += delta
             self.last_pan_point = event.pos()
-            self.update()  # Trigger repaint
+            
+            # Pan is a pure blit of the already-scaled display_pixmap - never re-scale here
+            self._redraw()
     
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Handle mouse release."""
@@ -283,28 +460,27 @@ class ImagePreviewWidget(QLabel):
             self.setCursor(Qt.CursorShape.ArrowCursor)
     
     def paintEvent(self, event: QPaintEvent):
-        """Custom paint to handle pan offset."""
+        """Custom paint to handle pan offset (blit only; scaling happens in update_display)."""
+        self._paint_pending = False
         if self.display_pixmap is None:
             super().paintEvent(event)
             return
         
         painter = QPainter(self)
         
-        # Calculate centered position
+        # Calculate centered position (pixmap size in logical pixels, as on HiDPI the
+        # pixmap has more device pixels than it covers)
         widget_rect = self.rect()
-        pixmap_rect = self.display_pixmap.rect()
+        pixmap_size = self.display_pixmap.deviceIndependentSize().toSize()
         
         # Center the image
-        x = (widget_rect.width() - pixmap_rect.width()) // 2
-        y = (widget_rect.height() - pixmap_rect.height()) // 2
+        x = (widget_rect.width() - pixmap_size.width()) // 2
+        y = (widget_rect.height() - pixmap_size.height()) // 2
         
         # Apply pan offset
         x += self.pan_offset.x()
         y += self.pan_offset.y()
         
-        # Draw background
-        painter.fillRect(widget_rect, QColor(240, 240, 240))
-        
         # Draw the image
         painter.drawPixmap(x, y, self.display_pixmap)
         
@@ -0,0 +1,96 @@
+"""Batch processing worker running off the GUI thread."""
+import asyncio
+from pathlib import Path
+from typing import List
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.application.use_cases.batch_process_use_case import BatchProcessUseCase
+
+
+class BatchWorkerSignals(QObject):
+    """Signals emitted by BatchWorker (delivered to GUI slots via queued connections)."""
+    
+    finished = pyqtSignal(object)  # BatchResult
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class BatchWorker(QRunnable):
+    """Run BatchProcessUseCase in its own event loop on a QThreadPool thread."""
+    
+    def __init__(
+        self,
+        batch_use_case: BatchProcessUseCase,
+        image_paths: List[Path],
+        output_folder: Path
+    ):
+        """
+        Initialize batch worker.
+        
+        Args:
+            batch_use_case: Configured batch use case
+            image_paths: Input image paths
+            output_folder: Output folder for results
+        """
+        super().__init__()
+        self.signals = BatchWorkerSignals()
+        self.batch_use_case = batch_use_case
+        self.image_paths = image_paths
+        self.output_folder = output_folder
+        
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._cancel_requested = False
+    
+    def run(self):
+        """Worker thread entry point."""
+        asyncio.run(self._run())
+    
+    async def _run(self):
+        """Execute batch and report the outcome through signals."""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        
+        try:
+            if self._cancel_requested:
+                raise asyncio.CancelledError()
+            
+            result = await self.batch_use_case.execute(
+                image_paths=self.image_paths,
+                output_folder=self.output_folder
+            )
+        except asyncio.CancelledError:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        
+        # Format the summary here so the GUI slot only has to show it
+        result.summary_text = (
+            f"Batch processing complete!\n\n"
+            f"Total: {result.total}\n"
+            f"Successful: {result.successful}\n"
+            f"Failed: {result.failed}\n"
+            f"Cached: {result.cached}\n"
+            f"Success rate: {result.success_rate:.1f}%\n"
+            f"Total time: {result.total_time_ms/1000:.1f}s\n\n"
+            f"Output folder: {self.output_folder}"
+        )
+        self.signals.finished.emit(result)
+    
+    @property
+    def processed(self) -> int:
+        """Images finished so far (the GUI samples this on a timer)."""
+        return self.batch_use_case.processed
+    
+    def cancel(self):
+        """Request cancellation (safe to call from the GUI thread)."""
+        self._cancel_requested = True
+        
+        if self._loop is not None and self._task is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed - batch has finished
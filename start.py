@@ -2,11 +2,11 @@
 """
 Launch script - Run from project root.
 """
-import sys
 import os
+import runpy
 
 # Change to project root
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-# Run as module
-os.system(f'{sys.executable} -m src.main')
+# Run as module, in this interpreter (no second Python start-up)
+runpy.run_module('src.main', run_name='__main__', alter_sys=True)
@@ -0,0 +1,48 @@
+"""Shared test fixtures."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def tiny_model(tmp_path) -> Path:
+    """
+    Stand-in for the BiRefNet ONNX model: (N, 3, H, W) image -> (N, 1, H, W) mask.
+    
+    The mask is sigmoid(mean over channels), so it runs in milliseconds on CPU
+    while keeping the real model's input/output layout.
+    """
+    onnx = pytest.importorskip("onnx")
+    from onnx import TensorProto, helper
+    
+    image = helper.make_tensor_value_info("input_image", TensorProto.FLOAT, ["N", 3, "H", "W"])
+    mask = helper.make_tensor_value_info("output_mask", TensorProto.FLOAT, ["N", 1, "H", "W"])
+    graph = helper.make_graph(
+        [
+            helper.make_node("ReduceMean", ["input_image"], ["mean"], axes=[1], keepdims=1),
+            helper.make_node("Sigmoid", ["mean"], ["output_mask"]),
+        ],
+        "tiny_birefnet",
+        [image],
+        [mask]
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    
+    path = tmp_path / "tiny.onnx"
+    onnx.save(model, str(path))
+    return path
+
+
+@pytest.fixture
+def sample_images(tmp_path) -> list:
+    """Two small RGB test images on disk."""
+    rng = np.random.default_rng(0)
+    paths = []
+    for i, size in enumerate([(48, 64), (30, 40)]):
+        path = tmp_path / f"sample_{i}.png"
+        Image.fromarray(rng.integers(0, 256, (*size, 3), dtype=np.uint8)).save(path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,158 @@
+"""Test batch process use case result cache."""
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.application.use_cases.batch_process_use_case import BatchProcessUseCase
+from src.domain.entities.settings import Settings
+from src.infrastructure.engines.onnx_birefnet_engine import OnnxBiRefNetEngine
+from src.infrastructure.image_io.local_image_io import LocalImageIO
+
+
+@pytest.fixture
+def batch(tiny_model, tmp_path):
+    """Batch use case on the tiny model, caching under tmp_path."""
+    settings = Settings(model_path=tiny_model)
+    engine = OnnxBiRefNetEngine(settings, enable_caching=False)
+    return BatchProcessUseCase(
+        engine, LocalImageIO(), settings, max_workers=2, cache_folder=tmp_path / "cache"
+    )
+
+
+def _write_entry(folder, name, size, age_s):
+    """Cache entry of `size` bytes last used `age_s` seconds ago."""
+    path = folder / f"{name}.png"
+    path.write_bytes(b"\0" * size)
+    used = time.time() - age_s
+    os.utime(path, (used, used))
+    return path
+
+
+def test_prune_cache_drops_expired_then_least_recently_used(batch):
+    """Pruning removes copy leftovers, entries past the TTL, then the oldest ones over the size cap."""
+    batch.cache_folder.mkdir()
+    batch.CACHE_MAX_BYTES = 250
+    batch.CACHE_TTL_S = 3600
+    
+    newest = _write_entry(batch.cache_folder, "newest", 100, 10)
+    recent = _write_entry(batch.cache_folder, "recent", 100, 20)
+    over_cap = _write_entry(batch.cache_folder, "over_cap", 100, 30)
+    expired = _write_entry(batch.cache_folder, "expired", 10, 7200)
+    leftover = batch.cache_folder / "interrupted.tmp"
+    leftover.write_bytes(b"\x89PNG")
+    
+    batch._prune_cache()
+    
+    assert newest.exists() and recent.exists()
+    assert not over_cap.exists()
+    assert not expired.exists()
+    assert not leftover.exists()
+
+
+def test_clear_cache(batch):
+    """clear_cache empties the cache folder."""
+    batch.cache_folder.mkdir()
+    _write_entry(batch.cache_folder, "entry", 10, 0)
+    
+    batch.clear_cache()
+    
+    assert list(batch.cache_folder.iterdir()) == []
+
+
+class CountingImageIO(LocalImageIO):
+    """LocalImageIO recording which load entry point was used."""
+    
+    def __init__(self):
+        self.path_loads = 0
+        self.bytes_loads = 0
+    
+    async def load_image(self, path):
+        self.path_loads += 1
+        return await super().load_image(path)
+    
+    async def load_image_bytes(self, data, path):
+        self.bytes_loads += 1
+        return await super().load_image_bytes(data, path)
+
+
+def test_cache_miss_then_hit(batch, sample_images, tmp_path):
+    """First run computes and caches every image, the second copies them from the cache."""
+    batch.image_io = CountingImageIO()
+    
+    first = asyncio.run(batch.execute(sample_images, tmp_path / "out1"))
+    assert (first.successful, first.cached, len(first.results)) == (2, 0, 2)
+    # Misses decode the bytes read for the hash instead of reading the file again
+    assert (batch.image_io.path_loads, batch.image_io.bytes_loads) == (0, 2)
+    assert len(list(batch.cache_folder.glob("*.png"))) == 2
+    
+    second = asyncio.run(batch.execute(sample_images, tmp_path / "out2"))
+    assert (second.successful, second.cached, len(second.results)) == (2, 2, 0)
+    assert batch.image_io.bytes_loads == 2  # Nothing decoded on hits
+    for path in sample_images:
+        name = f"{path.stem}_nobg.png"
+        assert (tmp_path / "out2" / name).read_bytes() == (tmp_path / "out1" / name).read_bytes()
+
+
+def test_unreadable_input_is_reported(batch, sample_images, tmp_path):
+    """A corrupt or missing file fails on its own; the others still complete."""
+    corrupt = tmp_path / "corrupt.png"
+    corrupt.write_bytes(b"not a png")
+    missing = tmp_path / "missing.png"
+    
+    result = asyncio.run(batch.execute([*sample_images, corrupt, missing], tmp_path / "out"))
+    
+    assert (result.total, result.successful, result.failed) == (4, 2, 2)
+    assert {path for path, _ in result.errors} == {corrupt, missing}
+    assert batch.processed == 4
+
+
+class SliderMovingImageIO(LocalImageIO):
+    """LocalImageIO that changes the shared settings mid-batch, like a UI slider."""
+    
+    def __init__(self, settings):
+        self.settings = settings
+    
+    async def load_image_bytes(self, data, path):
+        self.settings.threshold = 1.0
+        return await super().load_image_bytes(data, path)
+
+
+def test_settings_change_mid_batch_is_not_cached_under_old_key(batch, sample_images, tmp_path):
+    """A running batch computes and caches with the settings it started with."""
+    batch.image_io = SliderMovingImageIO(batch.settings)
+    asyncio.run(batch.execute(sample_images, tmp_path / "moved"))
+    
+    # Same settings as that batch started with, cache off: the expected outputs
+    batch.settings.threshold = 0.5
+    batch.image_io = LocalImageIO()
+    cache_folder, batch.cache_folder = batch.cache_folder, None
+    asyncio.run(batch.execute(sample_images, tmp_path / "expected"))
+    
+    for path in sample_images:
+        name = f"{path.stem}_nobg.png"
+        assert (tmp_path / "moved" / name).read_bytes() == (tmp_path / "expected" / name).read_bytes()
+    
+    batch.cache_folder = cache_folder
+    hits = asyncio.run(batch.execute(sample_images, tmp_path / "hits"))
+    assert hits.cached == 2
+
+
+def test_interrupted_cache_copy_is_not_a_hit(batch, sample_images, tmp_path, monkeypatch):
+    """A cache copy cut short never lands under the final key."""
+    import src.application.use_cases.batch_process_use_case as module
+    
+    def partial_copy(src, dst):
+        with open(dst, "wb") as f:
+            f.write(b"\x89PNG")
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(module.shutil, "copyfile", partial_copy)
+    first = asyncio.run(batch.execute(sample_images[:1], tmp_path / "out1"))
+    assert first.successful == 1
+    assert list(batch.cache_folder.iterdir()) == []
+    
+    monkeypatch.undo()
+    second = asyncio.run(batch.execute(sample_images[:1], tmp_path / "out2"))
+    assert (second.successful, second.cached) == (1, 0)
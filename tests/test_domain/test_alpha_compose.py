@@ -0,0 +1,38 @@
+"""Test alpha composition against the float reference."""
+from pathlib import Path
+
+import numpy as np
+
+from src.domain.entities.image_input import ImageInput
+from src.domain.entities.mask import Mask
+from src.domain.services.alpha_compose import AlphaCompose
+
+
+def test_compose_matches_float_reference():
+    """RGB is copied as is and alpha equals (mask * 255) truncated to uint8."""
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 256, (40, 60, 3), dtype=np.uint8)
+    mask_data = rng.random((40, 60), dtype=np.float32)
+    mask_data[0, :2] = (0.0, 1.0)
+    image = ImageInput(data=data, width=60, height=40, file_path=Path("in.png"))
+    mask = Mask(data=mask_data, width=60, height=40)
+    
+    out = np.empty((40, 60, 4), dtype=np.uint8)
+    result = AlphaCompose.compose(image, mask, out=out)
+    
+    assert result.data is out
+    assert (out[:, :, :3] == data).all()
+    assert (out[:, :, 3] == (mask_data * 255).astype(np.uint8)).all()
+    assert tuple(out[0, :2, 3]) == (0, 255)
+
+
+def test_write_alpha_leaves_rgb_untouched():
+    rng = np.random.default_rng(1)
+    out = rng.integers(0, 256, (20, 30, 4), dtype=np.uint8)
+    rgb = out[:, :, :3].copy()
+    mask = Mask(data=rng.random((20, 30), dtype=np.float32), width=30, height=20)
+    
+    AlphaCompose.write_alpha(mask, out)
+    
+    assert (out[:, :, :3] == rgb).all()
+    assert (out[:, :, 3] == (mask.data * 255).astype(np.uint8)).all()
@@ -0,0 +1,86 @@
+"""Test background replacement against the float reference blend."""
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from src.domain.entities.image_input import ImageInput
+from src.domain.entities.mask import Mask
+from src.domain.services.background_replacer import BackgroundReplacer
+
+
+H, W = 120, 160
+
+
+def _image(rng, height, width) -> ImageInput:
+    data = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    return ImageInput(data=data, width=width, height=height, file_path=Path("in.png"))
+
+
+def _reference(rgb, mask, background) -> np.ndarray:
+    """Float blend: fg * a + bg * (1 - a), clipped and truncated to uint8."""
+    alpha = mask.data[:, :, None]
+    blended = rgb.astype(np.float32) * alpha + np.asarray(background, dtype=np.float32) * (1 - alpha)
+    return np.clip(blended, 0, 255).astype(np.uint8)
+
+
+@pytest.fixture(params=[0, 1, 2])
+def scene(request):
+    """Random foreground and soft mask."""
+    rng = np.random.default_rng(request.param)
+    mask = Mask(data=rng.random((H, W), dtype=np.float32), width=W, height=H)
+    return rng, _image(rng, H, W), mask
+
+
+def _max_diff(result, expected) -> int:
+    assert result.data.shape == (H, W, 4)
+    assert (result.data[:, :, 3] == 255).all()
+    return np.abs(result.data[:, :, :3].astype(np.int16) - expected).max()
+
+
+def test_replace_with_color(scene):
+    _, image, mask = scene
+    color = (10, 200, 30)
+    
+    result = BackgroundReplacer.replace_with_color(image, mask, color)
+    
+    # Rounding instead of truncating: at most one level
+    assert _max_diff(result, _reference(image.data, mask, color)) <= 1
+
+
+def test_replace_with_image_keeps_resampling_overshoot(scene):
+    """The resized background is blended before clipping, like the float path."""
+    rng, image, mask = scene
+    background = _image(rng, 70, 90)
+    resized = cv2.resize(
+        background.data.astype(np.float32), (W, H), interpolation=cv2.INTER_LANCZOS4
+    )
+    assert resized.min() < 0 or resized.max() > 255  # Overshoot is actually exercised
+    
+    result = BackgroundReplacer.replace_with_image(image, mask, background)
+    
+    # Rounding, 8-bit alpha and the integer-rounded background: at most two levels
+    assert _max_diff(result, _reference(image.data, mask, resized)) <= 2
+
+
+def test_replace_with_blur(scene):
+    _, image, mask = scene
+    blurred = cv2.GaussianBlur(image.data, (15, 15), 0)
+    
+    result = BackgroundReplacer.replace_with_blur(image, mask, 15)
+    
+    assert _max_diff(result, _reference(image.data, mask, blurred)) <= 1
+
+
+def test_fully_opaque_and_transparent_mask_are_exact(scene):
+    """alpha 1 keeps the foreground, alpha 0 gives the background, bit for bit."""
+    _, image, _ = scene
+    mask_data = np.zeros((H, W), dtype=np.float32)
+    mask_data[:, : W // 2] = 1.0
+    mask = Mask(data=mask_data, width=W, height=H, is_binary=True)
+    
+    result = BackgroundReplacer.replace_with_color(image, mask, (1, 2, 3))
+    
+    assert (result.data[:, : W // 2, :3] == image.data[:, : W // 2]).all()
+    assert (result.data[:, W // 2 :, :3] == (1, 2, 3)).all()
@@ -0,0 +1,27 @@
+"""Test LocalImageIO PNG encoding."""
+import asyncio
+from pathlib import Path
+
+import numpy as np
+
+from src.domain.entities.image_output import ImageOutput
+from src.infrastructure.image_io.local_image_io import LocalImageIO
+
+
+def test_encoded_png_matches_saved_file(tmp_path):
+    """encode_png_* + save_bytes write exactly what save_png_* writes."""
+    image_io = LocalImageIO()
+    rgba = np.random.default_rng(0).integers(0, 256, (40, 60, 4), dtype=np.uint8)
+    output = ImageOutput(data=rgba, width=60, height=40, original_path=Path("in.png"))
+    mask = rgba[:, :, 0] >= 128
+    
+    asyncio.run(image_io.save_png_rgba(output, tmp_path / "rgba.png"))
+    asyncio.run(image_io.save_png_1bit(mask, tmp_path / "mask.png"))
+    rgba_png = asyncio.run(image_io.encode_png_rgba(output))
+    mask_png = asyncio.run(image_io.encode_png_1bit(mask))
+    
+    assert rgba_png == (tmp_path / "rgba.png").read_bytes()
+    assert mask_png == (tmp_path / "mask.png").read_bytes()
+    
+    asyncio.run(image_io.save_bytes(mask_png, tmp_path / "sub" / "copy.png"))
+    assert (tmp_path / "sub" / "copy.png").read_bytes() == mask_png
@@ -0,0 +1,31 @@
+"""Test benchmark batch mode."""
+import asyncio
+
+import pytest
+
+from tools.benchmark import Benchmark
+
+
+def test_run_batch_skips_unreadable_file(tiny_model, sample_images, tmp_path):
+    """A corrupt image is skipped and the batch still finishes."""
+    corrupt = tmp_path / "corrupt.png"
+    corrupt.write_bytes(b"not a png")
+    image_paths = [sample_images[0], corrupt, sample_images[1]]
+    
+    summary = asyncio.run(
+        asyncio.wait_for(Benchmark(tiny_model).run_batch(image_paths, concurrency=1), timeout=60)
+    )
+    
+    assert [r.image_path for r in summary.results] == [sample_images[0], sample_images[1]]
+
+
+def test_run_batch_all_unreadable(tiny_model, tmp_path):
+    """Nothing loadable still ends the run instead of waiting on the queue."""
+    missing = [tmp_path / "missing_a.png", tmp_path / "missing_b.png"]
+    
+    summary = asyncio.run(
+        asyncio.wait_for(Benchmark(tiny_model).run_batch(missing), timeout=60)
+    )
+    
+    assert summary.results == []
+    assert summary.avg_total_ms == 0.0
@@ -0,0 +1 @@
+"""UI layer tests."""
@@ -0,0 +1,88 @@
+"""Test image preview widget zoom/pan repaints (offscreen)."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtCore import QEvent, QObject, QPoint
+from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtWidgets import QApplication
+
+from src.ui.widgets.image_preview import ImagePreviewWidget
+
+
+class PaintCounter(QObject):
+    """Event filter counting paint events delivered to a widget."""
+    
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.count += 1
+        return False
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Shared QApplication for the module."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def preview(app):
+    """Shown preview widget holding a 200x100 image, with a paint counter."""
+    widget = ImagePreviewWidget()
+    widget.resize(500, 400)
+    widget.show()
+    
+    pixmap = QPixmap(200, 100)
+    pixmap.fill(QColor(255, 0, 0))
+    widget.set_image(pixmap)
+    app.processEvents()
+    
+    counter = PaintCounter()
+    widget.installEventFilter(counter)
+    widget.paint_counter = counter
+    yield widget
+    widget.removeEventFilter(counter)
+    widget.close()
+
+
+def _pan(app, widget, offset: QPoint):
+    """Pan the way mouseMoveEvent does and let the repaint run."""
+    widget.pan_offset += offset
+    widget._redraw()
+    app.processEvents()
+
+
+@pytest.mark.parametrize("action", ["fit_to_view", "reset_zoom"])
+def test_fit_and_reset_repaint_after_pan_at_same_zoom(app, preview, action):
+    """Fit/Reset at an unchanged zoom must still repaint the re-centred image."""
+    getattr(preview, action)()  # Settle on the zoom the action picks
+    app.processEvents()
+    
+    _pan(app, preview, QPoint(40, -25))
+    paints_before = preview.paint_counter.count
+    scaled_before = preview.display_pixmap
+    
+    getattr(preview, action)()
+    app.processEvents()
+    
+    assert preview.pan_offset == QPoint(0, 0)
+    assert preview.paint_counter.count > paints_before
+    # Same zoom: the already-scaled pixmap is reused, not rebuilt
+    assert preview.display_pixmap is scaled_before
+
+
+def test_zoom_change_rescales(app, preview):
+    """A different zoom rebuilds the display pixmap at the new size."""
+    preview.reset_zoom()
+    app.processEvents()
+    width_before = preview.display_pixmap.deviceIndependentSize().width()
+    
+    preview.zoom_in()
+    app.processEvents()
+    
+    assert preview.display_pixmap.deviceIndependentSize().width() == pytest.approx(width_before * 1.25, abs=1)
@@ -3,15 +3,18 @@
 Benchmark tool for BiRefNet ONNX engine performance.
 Tests inference performance with different providers and profiling.
 """
+import os
 import sys
 import time
-import cProfile
-import pstats
-import io
+import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import List, Optional
 import numpy as np
+import onnxruntime as ort
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,6 +23,7 @@ from src.domain.entities.settings import Settings
 from src.infrastructure.engines.onnx_birefnet_engine import OnnxBiRefNetEngine
 from src.infrastructure.engines.provider_manager import ProviderManager
 from src.infrastructure.image_io.local_image_io import LocalImageIO
+from src.domain.entities.image_input import ImageInput
 from src.application.use_cases.remove_background_use_case import RemoveBackgroundUseCase
 import asyncio
 
@@ -34,6 +38,7 @@ class BenchmarkResult:
     inference_ms: float
     postprocessing_ms: float
     total_ms: float
+    transfer_ms: float = 0.0  # Host<->device copies (IOBinding providers only)
     
     @property
     def fps(self) -> float:
@@ -44,7 +49,8 @@ class BenchmarkResult:
         return (
             f"{self.image_path.name:20s} | {self.resolution:10s} | "
             f"{self.provider:12s} | Pre: {self.preprocessing_ms:6.1f}ms | "
-            f"Inf: {self.inference_ms:6.1f}ms | Post: {self.postprocessing_ms:6.1f}ms | "
+            f"Inf: {self.inference_ms:6.1f}ms | Xfer: {self.transfer_ms:5.1f}ms | "
+            f"Post: {self.postprocessing_ms:6.1f}ms | "
             f"Total: {self.total_ms:7.1f}ms ({self.fps:.2f} FPS)"
         )
 
@@ -54,40 +60,52 @@ class BenchmarkSummary:
     """Summary of multiple benchmark runs."""
     results: List[BenchmarkResult]
     
+    @cached_property
+    def _totals(self) -> np.ndarray:
+        """Total ms per run, gathered once for all the statistics below."""
+        return np.fromiter((r.total_ms for r in self.results), dtype=np.float64, count=len(self.results))
+    
+    @cached_property
+    def _inferences(self) -> np.ndarray:
+        """Inference ms per run."""
+        return np.fromiter((r.inference_ms for r in self.results), dtype=np.float64, count=len(self.results))
+    
     @property
     def avg_total_ms(self) -> float:
-        if not self.results:
-            return 0.0
-        return sum(r.total_ms for r in self.results) / len(self.results)
+        return float(self._totals.mean()) if self._totals.size else 0.0
     
     @property
     def avg_inference_ms(self) -> float:
-        if not self.results:
-            return 0.0
-        return sum(r.inference_ms for r in self.results) / len(self.results)
+        return float(self._inferences.mean()) if self._inferences.size else 0.0
     
     @property
     def avg_fps(self) -> float:
-        if not self.results:
-            return 0.0
-        return sum(r.fps for r in self.results) / len(self.results)
+        positive = self._totals[self._totals > 0]
+        return float((1000.0 / positive).sum() / self._totals.size) if positive.size else 0.0
     
     @property
     def min_total_ms(self) -> float:
-        if not self.results:
-            return 0.0
-        return min(r.total_ms for r in self.results)
+        return float(self._totals.min()) if self._totals.size else 0.0
     
     @property
     def max_total_ms(self) -> float:
-        if not self.results:
-            return 0.0
-        return max(r.total_ms for r in self.results)
+        return float(self._totals.max()) if self._totals.size else 0.0
+    
+    @property
+    def p50_total_ms(self) -> float:
+        return float(np.percentile(self._totals, 50)) if self._totals.size else 0.0
+    
+    @property
+    def p99_total_ms(self) -> float:
+        return float(np.percentile(self._totals, 99)) if self._totals.size else 0.0
 
 
 class Benchmark:
     """Benchmark tool for performance testing."""
     
+    # OrtValue device names for providers timed through IOBinding
+    IOBINDING_DEVICES = {"CUDA": "cuda", "DirectML": "dml"}
+    
     def __init__(self, model_path: Path):
         """
         Initialize benchmark.
@@ -97,12 +115,115 @@ class Benchmark:
         """
         self.model_path = model_path
     
+    def quantized_model_path(self) -> Path:
+        """
+        Get the INT8 dynamically quantized model, creating it on first use.
+        
+        Returns:
+            Path to <model>.int8.onnx next to the FP32 model
+        """
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        
+        int8_path = self.model_path.with_suffix(".int8.onnx")
+        if int8_path.exists() and int8_path.stat().st_mtime >= self.model_path.stat().st_mtime:
+            return int8_path
+        
+        print(f"Quantizing {self.model_path.name} -> {int8_path.name} (one-time)...")
+        quantize_dynamic(
+            self.model_path,
+            int8_path,
+            weight_type=QuantType.QInt8,
+            per_channel=True
+        )
+        return int8_path
+    
+    async def compare_quantized(
+        self,
+        image_path: Path,
+        num_runs: int = 5
+    ) -> dict:
+        """
+        Compare the FP32 model against its INT8 quantized copy on CPU.
+        
+        Args:
+            image_path: Input image path
+            num_runs: Number of runs per model
+        
+        Returns:
+            Dict mapping "FP32" / "INT8" to BenchmarkSummary
+        """
+        results = {
+            "FP32": await self.run_single(image_path, provider="CPU", num_runs=num_runs),
+            "INT8": await Benchmark(self.quantized_model_path()).run_single(
+                image_path, provider="CPU", num_runs=num_runs
+            ),
+        }
+        
+        print(f"\n{'='*100}")
+        print("QUANTIZATION COMPARISON (CPU)")
+        print(f"{'='*100}")
+        
+        for precision, summary in results.items():
+            print(f"{precision:12s} | Avg: {summary.avg_total_ms:7.1f} ms | FPS: {summary.avg_fps:6.2f}")
+        
+        print(f"{'='*100}\n")
+        
+        return results
+    
+    def _make_settings(self, provider: str) -> Settings:
+        """
+        Build engine settings shared by every benchmark mode.
+        
+        Args:
+            provider: Execution provider (CPU, CUDA, DirectML)
+        
+        Returns:
+            Settings; the fused CPU graph is saved on the first run and loaded
+            directly afterwards, so session creation isn't re-measured each time
+        """
+        # One kernel thread per physical core (assumes 2-way SMT); hyperthread
+        # siblings fighting over the same caches make latency noisy
+        intra_op_threads = max(1, (os.cpu_count() or 2) // 2) if provider == "CPU" else 0
+        
+        return Settings(
+            model_path=self.model_path,
+            execution_provider=provider,
+            cache_optimized_model=True,
+            intra_op_threads=intra_op_threads
+        )
+    
+    def _build_pipeline(
+        self,
+        provider: str,
+        *,
+        enable_caching: bool = True,
+        enable_profiling: bool = False
+    ) -> tuple:
+        """
+        Build the engine, image I/O and use case every benchmark mode runs.
+        
+        Args:
+            provider: Execution provider (CPU, CUDA, DirectML)
+            enable_caching: Reuse/cache the session (off for a fresh profiled session)
+            enable_profiling: Turn on the ORT profiler from session creation
+        
+        Returns:
+            (engine, image_io, use_case)
+        """
+        settings = replace(self._make_settings(provider), enable_profiling=enable_profiling)
+        
+        engine = OnnxBiRefNetEngine(settings, enable_caching=enable_caching)
+        image_io = LocalImageIO()
+        use_case = RemoveBackgroundUseCase(engine, image_io, settings)
+        return engine, image_io, use_case
+    
     async def run_single(
         self,
         image_path: Path,
         provider: str = "CPU",
         num_runs: int = 5,
-        warmup: bool = True
+        warmup_runs: int = 3,
+        verbose: bool = False
     ) -> BenchmarkSummary:
         """
         Run benchmark on single image.
@@ -111,7 +232,9 @@ class Benchmark:
             image_path: Input image path
             provider: Execution provider (CPU, CUDA, DirectML)
             num_runs: Number of iterations
-            warmup: Whether to run warmup inference
+            warmup_runs: Untimed runs first, so conv algorithm search and memory
+                         patterns have settled (0 = none)
+            verbose: Print each run as it finishes instead of all at the end
             
         Returns:
             BenchmarkSummary
@@ -119,68 +242,56 @@ class Benchmark:
         print(f"\n{'='*100}")
         print(f"Benchmarking: {image_path.name}")
         print(f"Provider: {provider}")
-        print(f"Runs: {num_runs} (warmup: {warmup})")
+        print(f"Runs: {num_runs} (warmup runs: {warmup_runs})")
         print(f"{'='*100}\n")
         
         # Setup
-        settings = Settings(
-            model_path=self.model_path,
-            execution_provider=provider
-        )
-        
-        engine = OnnxBiRefNetEngine(settings, enable_caching=True)
-        image_io = LocalImageIO()
-        use_case = RemoveBackgroundUseCase(engine, image_io, settings)
+        engine, image_io, use_case = self._build_pipeline(provider)
         
         # Load image once
         image_input = await image_io.load_image(image_path)
-        resolution = f"{image_input.width}x{image_input.height}"
         
         results = []
         
-        # Warmup run
-        if warmup:
-            print("Warming up...")
-            _ = await use_case.execute(image_path)
+        # Benchmark runs
+        io_binding, device = self._bind_output(engine, provider)
+        
+        # Input tensor buffer allocated once (untimed), refilled by every run
+        input_buffer, _ = engine.preprocessor.preprocess(image_input.data)
+        output_buffer = None
+        if io_binding is None:
+            io_binding, output_buffer = self._bind_cpu(engine, input_buffer)
+        mask_buffer = np.empty((image_input.height, image_input.width), dtype=np.float32)
+        
+        # Warmup: end-to-end (engine warm-up), then the exact inference path timed
+        # below, so only settled runs reach the stats
+        if warmup_runs > 0:
+            print(f"Warming up ({warmup_runs} runs)...")
+            for _ in range(warmup_runs):
+                await use_case.execute(image_path)
+                self._infer(engine, io_binding, device, input_buffer, output_buffer)
             print("Warmup complete\n")
         
-        # Benchmark runs
         for i in range(num_runs):
-            # Time preprocessing
-            t0 = time.perf_counter()
-            input_tensor, original_size = engine.preprocessor.preprocess(image_input.data)
-            t1 = time.perf_counter()
-            preprocessing_ms = (t1 - t0) * 1000
-            
-            # Time inference
-            input_name = engine.session.get_inputs()[0].name
-            output_name = engine.session.get_outputs()[0].name
-            
-            t2 = time.perf_counter()
-            outputs = engine.session.run([output_name], {input_name: input_tensor})
-            t3 = time.perf_counter()
-            inference_ms = (t3 - t2) * 1000
-            
-            # Time postprocessing
-            t4 = time.perf_counter()
-            mask_data = engine.preprocessor.postprocess_mask(outputs[0], original_size)
-            t5 = time.perf_counter()
-            postprocessing_ms = (t5 - t4) * 1000
-            
-            total_ms = preprocessing_ms + inference_ms + postprocessing_ms
-            
-            result = BenchmarkResult(
-                image_path=image_path,
-                resolution=resolution,
-                provider=provider,
-                preprocessing_ms=preprocessing_ms,
-                inference_ms=inference_ms,
-                postprocessing_ms=postprocessing_ms,
-                total_ms=total_ms
+            result = self._timed_run(
+                engine, io_binding, device, image_input,
+                input_buffer, output_buffer, mask_buffer, provider
             )
-            
             results.append(result)
-            print(f"Run {i+1}/{num_runs}: {result}")
+            if verbose:
+                print(f"Run {i+1}/{num_runs}: {result}")
+        
+        # One write after the loop - a slow console stalling mid-run would
+        # otherwise show up in the next run's timings
+        if not verbose:
+            sys.stdout.write("".join(
+                f"Run {i+1}/{num_runs}: {result}\n" for i, result in enumerate(results)
+            ))
+        
+        # Free the session and its device memory before anything else builds one
+        # (the binding holds a reference to the session, so it goes first)
+        io_binding = None
+        engine.close()
         
         summary = BenchmarkSummary(results)
         
@@ -191,6 +302,233 @@ class Benchmark:
         print(f"Average Inference: {summary.avg_inference_ms:7.1f} ms")
         print(f"Min Total:         {summary.min_total_ms:7.1f} ms")
         print(f"Max Total:         {summary.max_total_ms:7.1f} ms")
+        print(f"P50 Total:         {summary.p50_total_ms:7.1f} ms")
+        print(f"P99 Total:         {summary.p99_total_ms:7.1f} ms")
+        print(f"{'='*100}\n")
+        
+        return summary
+    
+    def _bind_output(self, engine: OnnxBiRefNetEngine, provider: str) -> tuple:
+        """
+        Set up IOBinding for GPU providers, so the inference timing excludes the
+        host<->device copies, which are timed separately.
+        
+        Returns:
+            (io_binding, device), both None on CPU or if the engine fell back to CPU
+        """
+        device = None
+        if engine.session.get_providers()[0] != "CPUExecutionProvider":
+            device = self.IOBINDING_DEVICES.get(provider)
+        if device is None:
+            return None, None
+        
+        io_binding = engine.session.io_binding()
+        io_binding.bind_output(engine.output_name, device)
+        return io_binding, device
+    
+    @staticmethod
+    def _bind_cpu(engine: OnnxBiRefNetEngine, input_buffer: np.ndarray) -> tuple:
+        """
+        Bind the reused input buffer and a preallocated output buffer for CPU runs.
+        
+        ORT reads the input straight from input_buffer (refilled in place by the
+        preprocessor) and writes every run's mask into the same output array, so
+        neither side is allocated or converted per call.
+        
+        Returns:
+            (io_binding, output_buffer)
+        """
+        # Untimed probe run for the output shape (may be symbolic in the model)
+        probe = engine.session.run([engine.output_name], {engine.input_name: input_buffer})[0]
+        output_buffer = np.empty(probe.shape, dtype=np.float32)
+        
+        io_binding = engine.session.io_binding()
+        io_binding.bind_ortvalue_input(
+            engine.input_name, ort.OrtValue.ortvalue_from_numpy(input_buffer)
+        )
+        io_binding.bind_output(
+            engine.output_name, "cpu", 0, np.float32,
+            list(output_buffer.shape), output_buffer.ctypes.data
+        )
+        return io_binding, output_buffer
+    
+    def _timed_run(
+        self,
+        engine: OnnxBiRefNetEngine,
+        io_binding,
+        device,
+        image_input: ImageInput,
+        input_buffer: np.ndarray,
+        output_buffer: Optional[np.ndarray],
+        mask_buffer: Optional[np.ndarray],
+        provider: str
+    ) -> BenchmarkResult:
+        """
+        Time one preprocess -> inference -> postprocess pass.
+        
+        Args:
+            engine: Engine whose session and preprocessor are timed
+            io_binding: IOBinding from _bind_output or _bind_cpu
+            device: OrtValue device name, or None for CPU
+            image_input: Loaded image
+            input_buffer: Preallocated input tensor, refilled in place
+            output_buffer: CPU output array bound by _bind_cpu, or None
+            mask_buffer: (H, W) float32 postprocess output to reuse, or None
+            provider: Execution provider label for the result
+        
+        Returns:
+            BenchmarkResult
+        """
+        # Time preprocessing
+        t0 = time.perf_counter_ns()
+        input_tensor, original_size = engine.preprocessor.preprocess(
+            image_input.data, out=input_buffer
+        )
+        t1 = time.perf_counter_ns()
+        preprocessing_ms = (t1 - t0) / 1e6
+        
+        # Time inference
+        outputs, inference_ms, transfer_ms = self._infer(
+            engine, io_binding, device, input_tensor, output_buffer
+        )
+        
+        # Time postprocessing
+        t4 = time.perf_counter_ns()
+        engine.preprocessor.postprocess_mask(outputs[0], original_size, out=mask_buffer)
+        t5 = time.perf_counter_ns()
+        postprocessing_ms = (t5 - t4) / 1e6
+        
+        total_ms = preprocessing_ms + transfer_ms + inference_ms + postprocessing_ms
+        
+        return BenchmarkResult(
+            image_path=image_input.file_path,
+            resolution=f"{image_input.width}x{image_input.height}",
+            provider=provider,
+            preprocessing_ms=preprocessing_ms,
+            inference_ms=inference_ms,
+            postprocessing_ms=postprocessing_ms,
+            total_ms=total_ms,
+            transfer_ms=transfer_ms
+        )
+    
+    @staticmethod
+    def _infer(engine, io_binding, device, input_tensor, output_buffer=None) -> tuple:
+        """
+        Run one inference through IOBinding: on CPU both buffers are already bound,
+        on a device the input is uploaded first.
+        
+        Returns:
+            (outputs, inference ms, host<->device transfer ms)
+        """
+        if device is None:
+            t0 = time.perf_counter_ns()
+            engine.session.run_with_iobinding(io_binding)
+            return [output_buffer], (time.perf_counter_ns() - t0) / 1e6, 0.0
+        
+        t_up = time.perf_counter_ns()
+        device_input = ort.OrtValue.ortvalue_from_numpy(input_tensor, device, 0)
+        io_binding.bind_ortvalue_input(engine.input_name, device_input)
+        io_binding.synchronize_inputs()
+        t0 = time.perf_counter_ns()
+        engine.session.run_with_iobinding(io_binding)
+        # Fence the device queue before stopping the clock, so asynchronous
+        # kernel launches are not mistaken for finished work
+        io_binding.synchronize_outputs()
+        t1 = time.perf_counter_ns()
+        outputs = io_binding.copy_outputs_to_cpu()
+        transfer_ns = (t0 - t_up) + (time.perf_counter_ns() - t1)
+        return outputs, (t1 - t0) / 1e6, transfer_ns / 1e6
+    
+    async def run_batch(
+        self,
+        image_paths: List[Path],
+        provider: str = "CPU",
+        concurrency: int = 4,
+        verbose: bool = False
+    ) -> BenchmarkSummary:
+        """
+        Benchmark a set of images, loading the next ones while the current one runs.
+        
+        Args:
+            image_paths: Input image paths
+            provider: Execution provider (CPU, CUDA, DirectML)
+            concurrency: How many decoded images may wait ahead of inference
+            verbose: Print each image as it finishes instead of all at the end
+        
+        Returns:
+            BenchmarkSummary of per-image latencies
+        """
+        print(f"\n{'='*100}")
+        print(f"Batch benchmark: {len(image_paths)} images")
+        print(f"Provider: {provider}")
+        print(f"Prefetch: {concurrency}")
+        print(f"{'='*100}\n")
+        
+        engine, image_io, _ = self._build_pipeline(provider)
+        engine._warmup()
+        io_binding, device = self._bind_output(engine, provider)
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        
+        skipped = []
+        
+        async def produce():
+            try:
+                for path in image_paths:
+                    try:
+                        image_input = await image_io.load_image(path)
+                    except Exception as e:
+                        # One unreadable file shouldn't end the whole run
+                        skipped.append(path)
+                        print(f"Skipping {path.name}: {e}")
+                        continue
+                    await queue.put(image_input)
+            finally:
+                # Always end the stream, or the consumer waits on the queue forever
+                await queue.put(None)
+        
+        results = []
+        input_buffer = output_buffer = None
+        
+        t_start = time.perf_counter_ns()
+        producer = asyncio.create_task(produce())
+        try:
+            while (image_input := await queue.get()) is not None:
+                if input_buffer is None:
+                    input_buffer, _ = engine.preprocessor.preprocess(image_input.data)
+                    if io_binding is None:
+                        io_binding, output_buffer = self._bind_cpu(engine, input_buffer)
+                # Off the event loop, so the producer keeps decoding meanwhile
+                # (ORT releases the GIL while the session runs)
+                result = await asyncio.to_thread(
+                    self._timed_run, engine, io_binding, device,
+                    image_input, input_buffer, output_buffer, None, provider
+                )
+                results.append(result)
+                if verbose:
+                    print(result)
+            await producer  # Surface anything the producer raised
+        finally:
+            producer.cancel()
+        elapsed_s = (time.perf_counter_ns() - t_start) / 1e9
+        
+        if not verbose:
+            sys.stdout.write("".join(f"{result}\n" for result in results))
+        
+        io_binding = None
+        engine.close()
+        
+        summary = BenchmarkSummary(results)
+        throughput = len(results) / elapsed_s if elapsed_s > 0 else 0.0
+        
+        print(f"\n{'='*100}")
+        print("BATCH SUMMARY")
+        print(f"{'='*100}")
+        print(f"Images:            {len(results)} in {elapsed_s:.2f} s ({len(skipped)} skipped)")
+        print(f"Throughput:        {throughput:7.2f} imgs/sec")
+        print(f"Average Latency:   {summary.avg_total_ms:7.1f} ms")
+        print(f"P50 Latency:       {summary.p50_total_ms:7.1f} ms")
+        print(f"P99 Latency:       {summary.p99_total_ms:7.1f} ms")
         print(f"{'='*100}\n")
         
         return summary
@@ -220,14 +558,21 @@ class Benchmark:
         
         results = {}
         
+        # Each provider gets its own short-lived process: with a GPU provider loaded,
+        # ORT's allocators and thread pools are shared process-wide and skew the CPU
+        # numbers, and a cached session from one provider must not leak into the next
+        loop = asyncio.get_running_loop()
         for provider_key in available_providers:
             friendly_name = available_providers[provider_key]["name"]
-            summary = await self.run_single(
-                image_path,
-                provider=friendly_name,
-                num_runs=num_runs,
-                warmup=True
-            )
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                summary = await loop.run_in_executor(
+                    executor,
+                    run_single_in_subprocess,
+                    self.model_path,
+                    image_path,
+                    friendly_name,
+                    num_runs
+                )
             results[friendly_name] = summary
         
         # Print comparison
@@ -242,49 +587,79 @@ class Benchmark:
         
         return results
     
-    def profile_inference(
+    async def profile_inference(
         self,
         image_path: Path,
-        provider: str = "CPU"
+        provider: str = "CPU",
+        top: int = 30
     ):
         """
-        Profile inference with cProfile.
+        Profile inference with the ONNX Runtime per-op profiler.
         
         Args:
             image_path: Input image path
             provider: Execution provider
+            top: Number of op types to list
         """
         print(f"\n{'='*100}")
         print(f"Profiling: {image_path.name}")
         print(f"Provider: {provider}")
         print(f"{'='*100}\n")
         
-        # Setup
-        settings = Settings(
-            model_path=self.model_path,
-            execution_provider=provider
+        # Setup - a fresh (uncached) session so profiling is on from its creation
+        engine, _, use_case = self._build_pipeline(
+            provider, enable_caching=False, enable_profiling=True
         )
         
-        engine = OnnxBiRefNetEngine(settings)
-        image_io = LocalImageIO()
-        use_case = RemoveBackgroundUseCase(engine, image_io, settings)
-        
-        # Profile
-        profiler = cProfile.Profile()
-        profiler.enable()
+        # Run inference, then flush the trace
+        await use_case.execute(image_path)
+        profile_path = Path(engine.session.end_profiling())
         
-        # Run inference
-        asyncio.run(use_case.execute(image_path))
+        # Sum kernel time per (op type, provider); Python frames can't see inside session.run
+        with open(profile_path, 'r', encoding='utf-8') as f:
+            events = json.load(f)
         
-        profiler.disable()
+        totals = defaultdict(lambda: [0, 0])  # (op, provider) -> [total us, calls]
+        for event in events:
+            args = event.get("args", {})
+            if event.get("cat") != "Node" or "op_name" not in args:
+                continue
+            entry = totals[(args["op_name"], args.get("provider", "?"))]
+            entry[0] += event.get("dur", 0)
+            entry[1] += 1
         
-        # Print stats
-        s = io.StringIO()
-        stats = pstats.Stats(profiler, stream=s)
-        stats.sort_stats('cumulative')
-        stats.print_stats(30)  # Top 30 functions
-        
-        print(s.getvalue())
+        grand_total = sum(entry[0] for entry in totals.values()) or 1
+        print(f"{'Op':30s} | {'Provider':24s} | {'Calls':>6s} | {'Total ms':>10s} | {'Share':>6s}")
+        print("-" * 90)
+        for (op_name, op_provider), (dur_us, calls) in sorted(
+            totals.items(), key=lambda item: item[1][0], reverse=True
+        )[:top]:
+            print(
+                f"{op_name:30s} | {op_provider:24s} | {calls:6d} | "
+                f"{dur_us / 1000:10.1f} | {dur_us / grand_total:6.1%}"
+            )
+        print(f"\nFull trace: {profile_path} (open in chrome://tracing or Perfetto)\n")
+
+
+def run_single_in_subprocess(
+    model_path: Path,
+    image_path: Path,
+    provider: str,
+    num_runs: int
+) -> BenchmarkSummary:
+    """
+    Run Benchmark.run_single in a worker process (module-level so it pickles).
+    
+    Args:
+        model_path: Path to ONNX model
+        image_path: Input image path
+        provider: Execution provider
+        num_runs: Number of iterations
+    
+    Returns:
+        BenchmarkSummary
+    """
+    return asyncio.run(Benchmark(model_path).run_single(image_path, provider, num_runs))
 
 
 async def main():
@@ -301,9 +676,19 @@ async def main():
     parser.add_argument(
         "--image",
         type=Path,
-        required=True,
         help="Path to test image"
     )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        help="Folder of images to benchmark for throughput (instead of --image)"
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=4,
+        help="Images loaded ahead of inference in --batch mode"
+    )
     parser.add_argument(
         "--provider",
         type=str,
@@ -317,6 +702,17 @@ async def main():
         default=5,
         help="Number of runs"
     )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=3,
+        help="Untimed warmup runs before measuring"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print each run as it finishes (may perturb timings on slow consoles)"
+    )
     parser.add_argument(
         "--compare",
         action="store_true",
@@ -327,6 +723,11 @@ async def main():
         action="store_true",
         help="Run profiler"
     )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Compare FP32 against an INT8 dynamically quantized model (CPU)"
+    )
     
     args = parser.parse_args()
     
@@ -336,19 +737,32 @@ async def main():
         print("Please download BiRefNet ONNX model and place it in assets/models/")
         return
     
+    benchmark = Benchmark(args.model)
+    
+    if args.batch is not None:
+        image_paths = sorted(
+            p for p in args.batch.iterdir()
+            if p.suffix.lower() in LocalImageIO.SUPPORTED_FORMATS
+        ) if args.batch.is_dir() else []
+        if not image_paths:
+            print(f"Error: No images found in {args.batch}")
+            return
+        await benchmark.run_batch(image_paths, args.provider, args.prefetch, args.verbose)
+        return
+    
     # Check image exists
-    if not args.image.exists():
+    if args.image is None or not args.image.exists():
         print(f"Error: Image not found at {args.image}")
         return
     
-    benchmark = Benchmark(args.model)
-    
     if args.profile:
-        benchmark.profile_inference(args.image, args.provider)
+        await benchmark.profile_inference(args.image, args.provider)
+    elif args.quantize:
+        await benchmark.compare_quantized(args.image, args.runs)
     elif args.compare:
         await benchmark.compare_providers(args.image, args.runs)
     else:
-        await benchmark.run_single(args.image, args.provider, args.runs)
+        await benchmark.run_single(args.image, args.provider, args.runs, args.warmup, args.verbose)
 
 
 if __name__ == "__main__":
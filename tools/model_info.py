@@ -8,6 +8,52 @@ from pathlib import Path
 import onnxruntime as ort
 
 
+def read_signature(model_path: Path) -> tuple:
+    """
+    Read the model's input/output nodes.
+    
+    Uses the onnx package when installed: only the protobuf is parsed, external
+    weight files are never opened and no session is built. Falls back to a
+    CPU-only, unoptimized ONNX Runtime session otherwise.
+    
+    Returns:
+        (inputs, outputs), each a list of (name, shape, type)
+    """
+    try:
+        import onnx
+    except ImportError:
+        onnx = None
+    
+    if onnx is not None:
+        model = onnx.load(str(model_path), load_external_data=False)
+        
+        def describe(value_info):
+            tensor_type = value_info.type.tensor_type
+            shape = [dim.dim_value or dim.dim_param or None for dim in tensor_type.shape.dim]
+            type_name = onnx.TensorProto.DataType.Name(tensor_type.elem_type).lower()
+            return value_info.name, shape, f"tensor({type_name})"
+        
+        # Older exporters also list weights as graph inputs
+        initializers = {init.name for init in model.graph.initializer}
+        inputs = [describe(inp) for inp in model.graph.input if inp.name not in initializers]
+        outputs = [describe(out) for out in model.graph.output]
+        return inputs, outputs
+    
+    # Only the graph signature is needed: CPU provider only (no CUDA/cuDNN
+    # start-up on GPU builds) and no graph optimization passes
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    session = ort.InferenceSession(
+        str(model_path),
+        sess_options=sess_options,
+        providers=["CPUExecutionProvider"]
+    )
+    return (
+        [(inp.name, inp.shape, inp.type) for inp in session.get_inputs()],
+        [(out.name, out.shape, out.type) for out in session.get_outputs()]
+    )
+
+
 def inspect_model(model_path: str):
     """Inspect ONNX model and print details."""
     model_path = Path(model_path)
@@ -20,22 +66,22 @@ def inspect_model(model_path: str):
     print("=" * 60)
     
     try:
-        session = ort.InferenceSession(str(model_path))
+        inputs, outputs = read_signature(model_path)
         
         print("\nINPUT NODES:")
         print("-" * 60)
-        for inp in session.get_inputs():
-            print(f"Name:  {inp.name}")
-            print(f"Shape: {inp.shape}")
-            print(f"Type:  {inp.type}")
+        for name, shape, type_name in inputs:
+            print(f"Name:  {name}")
+            print(f"Shape: {shape}")
+            print(f"Type:  {type_name}")
             print()
         
         print("\nOUTPUT NODES:")
         print("-" * 60)
-        for out in session.get_outputs():
-            print(f"Name:  {out.name}")
-            print(f"Shape: {out.shape}")
-            print(f"Type:  {out.type}")
+        for name, shape, type_name in outputs:
+            print(f"Name:  {name}")
+            print(f"Shape: {shape}")
+            print(f"Type:  {type_name}")
             print()
         
         print("\nPROVIDERS AVAILABLE:")